@@ -1,20 +1,71 @@
 ```python
-import argparse
-import sys
-from docker_packager import package_model
+# Pre-rendered ``--help`` output, printed without building the argparse parser.
+# Regenerate with ``COLUMNS=80 python -c "import cli; print(cli._render_help())"``
+# whenever the arguments below change; tests/test_cli.py checks they match.
+_HELP_TEXT = """\
+usage: cli.py [-h] --input PATH --image NAME:TAG [--verbose]
+              [--timeout SECONDS] [--cache-from IMAGE] [--apt-package PACKAGE]
 
+Package ML models into Docker containers for easy deployment
 
-def main():
+options:
+  -h, --help            show this help message and exit
+  --input PATH, -i PATH
+                        Path to the model file (e.g., resnet18_full.pth,
+                        my_model.h5)
+  --image NAME:TAG, -t NAME:TAG
+                        Docker image name and tag (e.g., my_ai_model:1.0)
+  --verbose, -v         Stream docker build output in real time
+  --timeout SECONDS     Abort the docker build if it runs longer than SECONDS
+  --cache-from IMAGE    Pull IMAGE and reuse its layers as the build cache
+  --apt-package PACKAGE
+                        Install a system package into the image (repeatable)
+
+Examples:
+  cli.py -i resnet18_full.pth -t my_ai_model:1.0
+  cli.py --input model.h5 --image ml_model:latest
+"""
+
+
+def _positive_int(value):
     """
-    Main entry point for the AI model packager CLI.
+    Parse a strictly positive integer argument.
     
-    Parses command-line arguments and invokes the Docker packaging process
-    to containerize a machine learning model.
+    Args:
+        value: Raw command-line string.
+        
+    Returns:
+        int: The parsed value.
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer above 0.
+    """
+    import argparse
+    
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number}")
+    return number
+
+
+def _build_parser(prog=None):
+    """
+    Build the command-line argument parser.
+    
+    Args:
+        prog: Optional program name; defaults to the name argparse derives
+            from sys.argv.
     
     Returns:
-        int: Exit code (0 for success, 130 for user cancellation, 1 for errors)
+        argparse.ArgumentParser: Parser for all CLI options.
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Package ML models into Docker containers for easy deployment",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -37,12 +88,85 @@ Examples:
         metavar="NAME:TAG",
         help="Docker image name and tag (e.g., my_ai_model:1.0)"
     )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Stream docker build output in real time"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=_positive_int,
+        metavar="SECONDS",
+        help="Abort the docker build if it runs longer than SECONDS"
+    )
+    parser.add_argument(
+        "--cache-from",
+        metavar="IMAGE",
+        help="Pull IMAGE and reuse its layers as the build cache"
+    )
+    parser.add_argument(
+        "--apt-package",
+        dest="extra_apt_packages",
+        action="append",
+        metavar="PACKAGE",
+        help="Install a system package into the image (repeatable)"
+    )
+    return parser
+
+
+def _render_help():
+    """
+    Render the full help text from the real parser.
     
-    args = parser.parse_args()
+    Used to refresh _HELP_TEXT after changing the CLI arguments.
     
-    try:
-        package_model(args.input, args.image)
+    Returns:
+        str: The help output argparse would print for ``cli.py --help``.
+    """
+    return _build_parser(prog="cli.py").format_help().rstrip() + "\n"
+
+
+def main():
+    """
+    Main entry point for the AI model packager CLI.
+    
+    Parses command-line arguments and invokes the Docker packaging process
+    to containerize a machine learning model.
+    
+    Returns:
+        int: Exit code (0 for success, 130 for user cancellation, 1 for errors)
+    """
+    # Imported here so importing cli as a library stays free of side costs
+    import sys
+    
+    # Fast path: answer bare and help invocations without importing argparse
+    if len(sys.argv) == 1 or any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        print(_HELP_TEXT, end="")
         return 0
+    
+    args = _build_parser().parse_args()
+    
+    import logging
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
+    
+    # Imported lazily so --help and argument errors skip the packager entirely
+    from docker_packager import package_model
+    
+    try:
+        ok = package_model(
+            args.input,
+            args.image,
+            verbose=args.verbose,
+            timeout=args.timeout,
+            cache_from=args.cache_from,
+            extra_apt_packages=args.extra_apt_packages
+        )
+        return 0 if ok else 1
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         return 130
@@ -52,5 +176,6 @@ Examples:
 
 
 if __name__ == "__main__":
+    import sys
     sys.exit(main())
 ```
\ No newline at end of file
@@ -1,75 +1,275 @@
 ```python
+import hashlib
+import json
+import logging
 import os
+import socket
 import subprocess
 import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from string import Template
 
-DOCKERFILE = """\
-FROM python:3.9-slim
-WORKDIR /app
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = ["package_model", "check_docker_available"]
+
+log = logging.getLogger("packager")
+
+# Dependencies are installed into a venv in a builder stage and only the
+# venv is copied into the final image, leaving pip and its caches behind.
+# --system-site-packages keeps frameworks that ship with the base image.
+DOCKERFILE = Template("""\
+# syntax=docker/dockerfile:1.4
+FROM $base_image AS builder
 COPY requirements.txt ./
-RUN pip install --no-cache-dir -r requirements.txt
-COPY {model_filename} ./
-COPY infer.py .
+RUN --mount=type=cache,target=/root/.cache/pip,sharing=locked \\
+    python -m venv --system-site-packages /opt/venv && \\
+    /opt/venv/bin/pip install -r requirements.txt
+
+FROM $base_image
+${apt_layer}COPY --from=builder /opt/venv /opt/venv
+ENV PATH=/opt/venv/bin:$$PATH
+WORKDIR /app
+COPY infer.py preprocess.py model_loader.py ./
 COPY sample.jpg .
-CMD ["python", "infer.py", "--model", "{model_filename}", "--test-input", "sample.jpg"]
-"""
+COPY ${model_files} ./
+CMD ["python", "infer.py", "--model", "${model_filename}", "--test-input", "sample.jpg"]
+""")
+
+# Base images that already ship the framework, keyed by model file extension
+_BASE_IMAGES = {
+    ".pth": "pytorch/pytorch:2.3.0-cuda12.1-cudnn8-runtime",
+    ".safetensors": "pytorch/pytorch:2.3.0-cuda12.1-cudnn8-runtime",
+    ".h5": "tensorflow/tensorflow:2.15.0",
+}
+
+# Plain Python base for everything else
+_DEFAULT_BASE_IMAGE = "python:3.10-slim-bookworm"
+
+# Container dependencies keyed by model file extension; framework packages
+# are omitted where the base image already provides them. Versions are
+# pinned so the pip layer is reproducible and stays cached between builds.
+# Stored as bytes so they are written without re-encoding.
+_REQUIREMENTS = {
+    ".pth": b"onnxruntime==1.18.1\nPillow==10.4.0\n",
+    ".h5": b"Pillow==10.4.0\n",
+    ".onnx": b"onnxruntime==1.18.1\nPillow==10.4.0\n",
+    ".safetensors": b"onnxruntime==1.18.1\nsafetensors==0.4.3\nPillow==10.4.0\n",
+}
+
+# Fallback for unknown model types
+_DEFAULT_REQUIREMENTS = b"torch==2.3.1\ntensorflow==2.15.1\nPillow==10.4.0\n"
+
+# Optional system packages; only emitted when requested so plain builds
+# carry no apt layer. The cache mounts keep package lists and downloads
+# between builds (docker-clean would otherwise delete them).
+APT_LAYER = Template("""\
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \\
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \\
+    rm -f /etc/apt/apt.conf.d/docker-clean && \\
+    apt-get update && \\
+    apt-get install -y --no-install-recommends $packages
+""")
+
+# Python sources the container runs, copied from the working directory
+_APP_SCRIPTS = ("infer.py", "preprocess.py", "model_loader.py")
+
+# Pre-exported ONNX graphs that infer.py runs with ONNX Runtime, staged next
+# to the model so the container never exports at startup. Keep in sync with
+# infer._ORT_MODEL_EXTS; every extension listed here needs onnxruntime in
+# its _REQUIREMENTS entry.
+_ORT_MODEL_EXTS = (".pth", ".safetensors")
+_ORT_SIBLING_EXTS = (".onnx", ".int8.onnx")
+
+# Only the files the Dockerfile needs are sent to the daemon
+DOCKERIGNORE = Template("""\
+*
+!Dockerfile
+!requirements.txt
+!infer.py
+!preprocess.py
+!model_loader.py
+!sample.jpg
+${model_whitelist}
+""")
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Seconds a Docker availability result is reused before probing again
+_DOCKER_CHECK_TTL = 60.0
+
+# Last check_docker_available() result and when it stops being reused
+_docker_check = None
+_docker_check_expiry = 0.0
 
+# FICLONE ioctl request number from <linux/fs.h>
+_FICLONE = 0x40049409
 
-def check_docker_available():
+# Buffer size for the plain copy fallback; large buffers amortise syscalls
+# when staging multi-GB model files
+_COPY_BUFSIZE = 8 * 1024 * 1024
+
+# Read size for docker build output; the pipe is grown to match where the
+# platform allows it so a chatty build is drained in few large reads
+_BUILD_READ_SIZE = 1024 * 1024
+
+# F_SETPIPE_SZ from <linux/fcntl.h>; exposed by fcntl only on Python 3.10+
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# Bytes of build output replayed on failure when not running verbosely
+_BUILD_LOG_TAIL_BYTES = 16 * 1024
+
+# Build inputs already turned into an image, keyed by content hash, so an
+# unchanged model can be re-tagged instead of rebuilt
+_BUILD_INDEX_PATH = Path.home() / ".cache" / "ai-model-packager" / "index.json"
+
+# Reused read buffer size for hashing on Pythons without hashlib.file_digest
+_DIGEST_BUFSIZE = 1024 * 1024
+
+
+def _ping_docker_socket(socket_path=DOCKER_SOCKET, timeout=1.0):
+    """Ping the Docker daemon directly over its UNIX socket.
+    
+    Sends a bare ``GET /_ping`` request, which the daemon answers in a single
+    round trip without spawning the docker CLI.
+    
+    Args:
+        socket_path: Path to the Docker daemon socket.
+        timeout: Socket timeout in seconds.
+        
+    Returns:
+        bool: True if the daemon answered with HTTP 200, False otherwise.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(b"GET /_ping HTTP/1.0\r\nHost: docker\r\n\r\n")
+        status_line = sock.makefile("rb").readline()
+    return b" 200 " in status_line
+
+
+def check_docker_available(force=False):
     """Check if Docker daemon is running and accessible.
     
+    The result is reused for ``_DOCKER_CHECK_TTL`` seconds, so packaging
+    several models in one process probes the daemon only once.
+    
+    Args:
+        force: If True, ignore any cached result and probe again.
+    
+    Returns:
+        tuple: ``(available, message)`` where ``available`` is True if Docker
+        is responsive and ``message`` describes the failure otherwise.
+    """
+    global _docker_check, _docker_check_expiry
+    
+    now = time.monotonic()
+    if not force and _docker_check is not None and now < _docker_check_expiry:
+        return _docker_check
+    
+    _docker_check = _probe_docker()
+    _docker_check_expiry = now + _DOCKER_CHECK_TTL
+    return _docker_check
+
+
+def _probe_docker():
+    """Probe the Docker daemon once.
+    
     Returns:
-        bool: True if Docker is available and responsive, False otherwise.
+        tuple: ``(available, message)`` as for check_docker_available().
     """
+    log.info("Checking Docker daemon availability...")
+    
+    # Talk to the local socket directly unless a remote daemon is configured
+    if (not os.environ.get("DOCKER_HOST")
+            and hasattr(socket, "AF_UNIX")
+            and os.path.exists(DOCKER_SOCKET)):
+        try:
+            if _ping_docker_socket():
+                log.info("SUCCESS: Docker daemon is running and responsive")
+                return True, ""
+            log.error("ERROR: Docker daemon not responding properly")
+            return False, "Docker daemon not responding properly"
+        except socket.timeout:
+            log.error("TIMEOUT: Docker daemon check timed out")
+            log.info("INFO: Try restarting Docker Desktop from system tray")
+            return False, "Docker daemon check timed out"
+        except OSError:
+            # e.g. permission denied on the socket; let the CLI decide
+            pass
+    
     try:
-        print("Checking Docker daemon availability...")
         result = subprocess.run(
-            ["docker", "version", "--format", "json"],
+            ["docker", "info", "--format", "{{.ServerVersion}}"],
             capture_output=True,
             text=True,
             timeout=5
         )
         
         if result.returncode == 0:
-            print("SUCCESS: Docker daemon is running and responsive")
-            return True
+            log.info("SUCCESS: Docker daemon is running and responsive")
+            return True, ""
         else:
-            print("ERROR: Docker daemon not responding properly")
+            log.error("ERROR: Docker daemon not responding properly")
             if result.stderr:
-                print(f"Error details: {result.stderr}")
-            return False
+                log.error(f"Error details: {result.stderr}")
+            return False, result.stderr or "Docker daemon not responding properly"
             
     except subprocess.TimeoutExpired:
-        print("TIMEOUT: Docker daemon check timed out")
-        print("INFO: Try restarting Docker Desktop from system tray")
-        return False
+        log.error("TIMEOUT: Docker daemon check timed out")
+        log.info("INFO: Try restarting Docker Desktop from system tray")
+        return False, "Docker daemon check timed out"
     except FileNotFoundError:
-        print("ERROR: Docker command not found - Docker may not be installed")
-        return False
+        log.error("ERROR: Docker command not found - Docker may not be installed")
+        return False, "Docker command not found"
     except Exception as e:
-        print(f"ERROR: Docker check failed: {e}")
-        return False
+        log.error(f"ERROR: Docker check failed: {e}")
+        return False, f"Docker check failed: {e}"
 
 
-def _get_requirements_for_model(model_path):
-    """Determine required dependencies based on model file extension.
+def _ort_siblings(model_path):
+    """Find pre-exported ONNX files next to a PyTorch model.
+    
+    Only files at least as new as the model are returned; infer.py ignores
+    older ones as stale.
     
     Args:
-        model_path: Path to the model file.
+        model_path: Path object for the model file.
         
     Returns:
-        str: Requirements file content with necessary dependencies.
+        list: Paths of the ONNX siblings to stage with the model.
     """
-    ext = Path(model_path).suffix.lower()
+    if model_path.suffix.lower() not in _ORT_MODEL_EXTS:
+        return []
+    model_mtime = model_path.stat().st_mtime
+    siblings = []
+    for ext in _ORT_SIBLING_EXTS:
+        sibling = model_path.with_suffix(ext)
+        try:
+            if sibling.stat().st_mtime >= model_mtime:
+                siblings.append(sibling)
+        except OSError:
+            pass
+    return siblings
+
+
+def _get_requirements_for_model(model_ext):
+    """Determine required dependencies based on model file extension.
     
-    if ext == '.pth':
-        return "torch\ntorchvision\nPillow\n"
-    elif ext == '.h5':
-        return "tensorflow\nPillow\n"
-    else:
-        # Fallback for unknown model types
-        return "torch\ntensorflow\nPillow\n"
+    Args:
+        model_ext: Lower-cased model file extension, including the dot.
+        
+    Returns:
+        bytes: Requirements file content with necessary dependencies.
+    """
+    return _REQUIREMENTS.get(model_ext, _DEFAULT_REQUIREMENTS)
 
 
 def _create_sample_image(sample_path):
@@ -81,22 +281,15 @@ def _create_sample_image(sample_path):
     if os.path.exists(sample_path):
         return
     
-    print("Creating sample image...")
+    log.info("Creating sample image...")
     try:
-        subprocess.run(
-            ["python", "-c", 
-             "from PIL import Image; Image.new('RGB', (224,224), 'blue').save('sample.jpg')"],
-            check=True,
-            timeout=10
-        )
-    except subprocess.TimeoutExpired:
-        print("WARNING: Sample image creation timed out")
-        _create_placeholder_image(sample_path)
-    except subprocess.CalledProcessError:
-        print("WARNING: PIL not available, creating placeholder")
+        from PIL import Image
+        Image.new('RGB', (224, 224), 'blue').save(sample_path, 'JPEG')
+    except ImportError:
+        log.warning("WARNING: PIL not available, creating placeholder")
         _create_placeholder_image(sample_path)
     except Exception as e:
-        print(f"WARNING: Failed to create sample image: {e}")
+        log.warning(f"WARNING: Failed to create sample image: {e}")
         _create_placeholder_image(sample_path)
 
 
@@ -110,43 +303,472 @@ def _create_placeholder_image(sample_path):
         with open(sample_path, 'w') as f:
             f.write("# Placeholder image file\n")
     except Exception as e:
-        print(f"WARNING: Failed to create placeholder image: {e}")
+        log.warning(f"WARNING: Failed to create placeholder image: {e}")
+
+
+def _clear_build_context(ctx, keep):
+    """Remove leftovers from previous runs from the build context.
+    
+    Args:
+        ctx: Build context directory.
+        keep: Names of entries that the current run stages.
+    """
+    for entry in ctx.iterdir():
+        if entry.name in keep:
+            continue
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+
+
+def _copy_file_contents(src, dst):
+    """Copy a file's bytes, permission bits and timestamps.
+    
+    On Linux the copy stays in the kernel, first via ``os.copy_file_range``
+    (server-side copy on NFS, reflink on CoW filesystems) and then via
+    ``os.sendfile``. Elsewhere it falls back to a buffered copy with a large
+    buffer.
+    
+    Args:
+        src: Path to the source file.
+        dst: Destination file path.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        src_stat = os.fstat(src_fd)
+        size = src_stat.st_size
+        
+        kernel_copies = []
+        if sys.platform.startswith("linux"):
+            if hasattr(os, "copy_file_range"):
+                kernel_copies.append(
+                    lambda offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+                )
+            if hasattr(os, "sendfile"):
+                kernel_copies.append(
+                    lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count)
+                )
+        
+        copied = False
+        for copy_range in kernel_copies:
+            offset = 0
+            try:
+                while offset < size:
+                    sent = copy_range(offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = offset >= size
+            except OSError:
+                pass
+            if copied:
+                break
+            fdst.seek(0)
+            fdst.truncate()
+        
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
+    
+    shutil.copymode(src, dst)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _is_staged(src, dst):
+    """Check whether a previous run already staged ``src`` at ``dst``.
+    
+    Staged copies keep the source's size and mtime, so matching metadata
+    means the (possibly large) file does not need to be read or copied.
+    
+    Args:
+        src: Path to the source file.
+        dst: Destination path inside the build context.
+        
+    Returns:
+        bool: True if ``dst`` is a link to or an up-to-date copy of ``src``.
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if os.path.samestat(src_stat, dst_stat):
+        return True
+    return (src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+
+def _stage_file(src, dst):
+    """Place a file into the build context as cheaply as possible.
+    
+    Skips files already staged by a previous run, then tries, in order, a
+    hardlink, a copy-on-write reflink (Linux FICLONE) and finally a byte
+    copy via _copy_file_contents().
+    
+    Args:
+        src: Path to the source file.
+        dst: Destination path inside the build context.
+    """
+    dst = Path(dst)
+    if _is_staged(src, dst):
+        return
+    
+    # Never write through a hardlink left behind by a previous run
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    
+    _copy_file_contents(src, dst)
+
+
+def _write_all(ctx, files):
+    """Write small generated files into the build context.
+    
+    Each file is written with a single open/write/close on a raw descriptor.
+    Files whose content would not change are left untouched so their mtimes
+    stay stable, which helps Docker's layer cache.
+    
+    Args:
+        ctx: Build context directory.
+        files: Iterable of (file name, bytes) pairs.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for name, data in files:
+        path = ctx / name
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                continue
+        except FileNotFoundError:
+            pass
+        
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _same_file_content(src, dst):
+    """Check whether a staged file already matches its source.
+    
+    Args:
+        src: Path to the source file.
+        dst: Path to the staged copy.
+        
+    Returns:
+        bool: True if ``dst`` exists with the same bytes as ``src``.
+    """
+    dst = Path(dst)
+    if not dst.exists():
+        return False
+    if os.path.samefile(src, dst):
+        return True
+    if os.path.getsize(src) != dst.stat().st_size:
+        return False
+    return Path(src).read_bytes() == dst.read_bytes()
+
+
+def _stage_optional_file(src, dst):
+    """Stage a file that the image can be built without.
+    
+    Args:
+        src: Path to the source file.
+        dst: Destination path inside the build context.
+    """
+    if not os.path.exists(src):
+        log.warning(f"WARNING: File not found, skipping: {src}")
+        return
+    if _same_file_content(src, dst):
+        return
+    _stage_file(src, dst)
+
+
+def _stage_sample_image(sample_path, dst):
+    """Create the sample image if needed and stage it.
+    
+    Args:
+        sample_path: Path of the sample image in the working directory.
+        dst: Destination path inside the build context.
+    """
+    _create_sample_image(sample_path)
+    _stage_optional_file(sample_path, dst)
+
+
+def _start_cache_pull(cache_from):
+    """Start pulling an image to use as a build cache source.
+    
+    The pull runs in the background so it overlaps with build context
+    staging; collect it with _wait_for_cache_pull() before building.
+    
+    Args:
+        cache_from: Name of the image to pull.
+        
+    Returns:
+        subprocess.Popen or None: The running pull, or None if it could not
+        be started.
+    """
+    log.info(f"Pulling cache image in the background: {cache_from}")
+    try:
+        return subprocess.Popen(
+            ["docker", "pull", cache_from],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except Exception as e:
+        log.warning(f"WARNING: Failed to pull cache image: {e}")
+        return None
+
+
+def _wait_for_cache_pull(pull_proc, cache_from):
+    """Wait for a background cache pull to finish.
+    
+    A failed pull is not fatal; the build simply starts without the cache.
+    
+    Args:
+        pull_proc: Process returned by _start_cache_pull(), or None.
+        cache_from: Name of the image being pulled.
+    """
+    if pull_proc is None:
+        return
+    if pull_proc.wait() != 0:
+        log.warning(f"WARNING: Could not pull cache image {cache_from}, building without it")
 
 
-def _verify_docker_image(image_name):
+def _verify_docker_image(image_name, iid_path):
     """Verify that the Docker image was created successfully.
     
+    Reads the image ID that ``docker build --iidfile`` wrote, so no extra
+    round trip to the daemon is needed.
+    
     Args:
         image_name: Name of the Docker image to verify.
+        iid_path: Path of the file the build wrote the image ID to.
         
     Returns:
-        bool: True if verification succeeded or was skipped, False otherwise.
+        bool: True if the build produced an image ID, False otherwise.
     """
-    print("Verifying image...")
+    log.info("Verifying image...")
     try:
-        verify_result = subprocess.run(
-            ["docker", "images", image_name, "--format", "table {{.Repository}}:{{.Tag}}"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        image_id = iid_path.read_text().strip()
+    except OSError as e:
+        log.error(f"ERROR: Build did not report an image ID: {e}")
+        return False
+    
+    if not image_id.startswith("sha256:"):
+        log.error(f"ERROR: Unexpected image ID from build: {image_id!r}")
+        return False
+    
+    log.info(f"VERIFIED: Image {image_name} ({image_id[:19]}) exists and ready to use!")
+    log.info("")
+    log.info("Next steps:")
+    log.info(f"   • Test container: docker run --rm {image_name}")
+    log.info(f"   • Run inference: docker run --rm {image_name}")
+    return True
+
+
+def _model_digest(path):
+    """Compute the SHA-256 of a model file.
+    
+    Reads into a reused buffer rather than allocating a new bytes object
+    per chunk, so hashing large models stays bound by disk bandwidth.
+    
+    Args:
+        path: Path to the model file.
+        
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        buf = memoryview(bytearray(_DIGEST_BUFSIZE))
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(buf[:n])
+        return digest.hexdigest()
+
+
+def _build_key(model_digest, ctx, siblings=()):
+    """Derive a cache key for everything that goes into the image.
+    
+    Args:
+        model_digest: Hex digest of the model file.
+        ctx: Staged build context directory.
+        siblings: Staged ONNX siblings of the model, hashed by content.
+        
+    Returns:
+        str: Hex digest covering the model and the staged build files.
+    """
+    key = hashlib.sha256(model_digest.encode("ascii"))
+    for name in ("Dockerfile", "requirements.txt", *_APP_SCRIPTS, "sample.jpg"):
+        path = ctx / name
+        key.update(name.encode("ascii"))
+        if path.exists():
+            key.update(path.read_bytes())
+    for sibling in siblings:
+        key.update(sibling.name.encode("utf-8"))
+        key.update(_model_digest(sibling).encode("ascii"))
+    return key.hexdigest()
+
+
+def _load_build_index():
+    """Load the build-key -> image ID index, or an empty one."""
+    try:
+        return json.loads(_BUILD_INDEX_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_build(build_key, iid_path):
+    """Remember the image produced for a build key.
+    
+    Failures are ignored; the index is only an optimisation.
+    
+    Args:
+        build_key: Key returned by _build_key().
+        iid_path: Path of the file the build wrote the image ID to.
+    """
+    try:
+        index = _load_build_index()
+        index[build_key] = iid_path.read_text().strip()
+        _BUILD_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _BUILD_INDEX_PATH.write_text(json.dumps(index, indent=2))
+    except OSError as e:
+        log.debug(f"Could not update build index: {e}")
+
+
+def _reuse_previous_build(build_key, image_name):
+    """Tag an image previously built from identical inputs.
+    
+    Args:
+        build_key: Key returned by _build_key().
+        image_name: Name to give the existing image.
+        
+    Returns:
+        bool: True if an existing image was tagged, False if a build is needed.
+    """
+    image_id = _load_build_index().get(build_key)
+    if not image_id:
+        return False
+    
+    try:
+        result = subprocess.run(
+            ["docker", "tag", image_id, image_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
+    except OSError:
+        return False
+    if result.returncode != 0:
+        # The image was removed since it was recorded; build it again
+        return False
+    
+    log.info(f"SUCCESS: Inputs unchanged, tagged existing image {image_id[:19]} as {image_name}")
+    return True
+
+
+def _write_raw_output(data):
+    """Write subprocess output bytes to stdout without re-encoding.
+    
+    Args:
+        data: Bytes to write.
+    """
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8", errors="replace"))
+        sys.stdout.flush()
+    else:
+        buffer.write(data)
+        buffer.flush()
+
+
+def _stream_build(cmd, verbose=False, timeout=None, env=None):
+    """Run a docker build command, consuming its output as it is produced.
+    
+    Args:
+        cmd: The docker build command line.
+        verbose: If True, echo build output in real time.
+        timeout: Optional wall-clock limit in seconds for the whole build.
+        env: Optional environment for the build process.
         
-        if verify_result.returncode == 0 and image_name in verify_result.stdout:
-            print(f"VERIFIED: Image {image_name} exists and ready to use!")
-            print()
-            print("Next steps:")
-            print(f"   • Test container: docker run --rm {image_name}")
-            print(f"   • Run inference: docker run --rm {image_name}")
-            return True
-        else:
-            print("WARNING: Build succeeded but image verification failed")
-            return True
-    except subprocess.TimeoutExpired:
-        print("WARNING: Image verification timed out")
-        return True
-    except Exception as e:
-        print(f"WARNING: Image verification failed: {e}")
-        return True
+    Returns:
+        int: Return code of the build process.
+        
+    Raises:
+        subprocess.TimeoutExpired: If the build exceeded ``timeout``.
+    """
+    # Output is handled as raw bytes; nothing is decoded unless it is shown
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env
+    )
+    
+    # A watchdog enforces the deadline even while we block reading output
+    timed_out = threading.Event()
+    watchdog = None
+    if timeout:
+        def _kill():
+            timed_out.set()
+            proc.kill()
+        watchdog = threading.Timer(timeout, _kill)
+        watchdog.daemon = True
+        watchdog.start()
+    
+    fd = proc.stdout.fileno()
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.fcntl(fd, _F_SETPIPE_SZ, _BUILD_READ_SIZE)
+        except OSError:
+            pass  # Above /proc/sys/fs/pipe-max-size; keep the default
+    tail = bytearray()
+    try:
+        while True:
+            chunk = os.read(fd, _BUILD_READ_SIZE)
+            if not chunk:
+                break
+            if verbose:
+                _write_raw_output(chunk)
+            tail += chunk
+            if len(tail) > _BUILD_LOG_TAIL_BYTES:
+                del tail[:-_BUILD_LOG_TAIL_BYTES]
+        proc.wait()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+        proc.stdout.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    if proc.returncode != 0 and not verbose:
+        _write_raw_output(bytes(tail))
+    return proc.returncode
 
 
 def _fallback_to_python_package(model_path, image_name):
@@ -159,8 +781,8 @@ def _fallback_to_python_package(model_path, image_name):
     Returns:
         bool: True if fallback packaging succeeded, False otherwise.
     """
-    print("WARNING: Docker is not available!")
-    print("INFO: Falling back to Python packaging alternative...")
+    log.warning("WARNING: Docker is not available!")
+    log.info("INFO: Falling back to Python packaging alternative...")
     
     try:
         from package_python import create_python_package
@@ -168,18 +790,19 @@ def _fallback_to_python_package(model_path, image_name):
             model_path,
             f"{image_name.replace(':', '_')}_package"
         )
-        print(f"SUCCESS: Created Python package instead: {package_file}")
-        print("INFO: You can run this package with: python -m zipapp <package_file>")
+        log.info(f"SUCCESS: Created Python package instead: {package_file}")
+        log.info("INFO: You can run this package with: python -m zipapp <package_file>")
         return True
     except ImportError:
-        print("ERROR: Python packaging fallback not available")
+        log.error("ERROR: Python packaging fallback not available")
         return False
     except Exception as e:
-        print(f"ERROR: Python packaging failed: {e}")
+        log.error(f"ERROR: Python packaging failed: {e}")
         return False
 
 
-def package_model(model_path, image_name):
+def package_model(model_path, image_name, verbose=False, timeout=None,
+                  cache_from=None, extra_apt_packages=None):
     """Build a Docker image containing the model and inference environment.
     
     The image includes:
@@ -192,108 +815,184 @@ def package_model(model_path, image_name):
     Args:
         model_path: Path to the model file to package.
         image_name: Name for the resulting Docker image.
+        verbose: If True, stream docker build output in real time.
+        timeout: Optional limit in seconds for the docker build step.
+        cache_from: Optional image (e.g. in a registry) to pull and reuse as
+            a layer cache. Defaults to a local image named ``image_name``.
+        extra_apt_packages: Optional list of system packages (e.g.
+            ``["libgomp1"]``) to install into the image with apt-get.
         
     Returns:
         bool: True if packaging succeeded, False otherwise.
     """
     # Validate inputs
     if not os.path.exists(model_path):
-        print(f"ERROR: Model file not found: {model_path}")
+        log.error(f"ERROR: Model file not found: {model_path}")
         return False
     
     if not image_name or not isinstance(image_name, str):
-        print("ERROR: Invalid image name provided")
+        log.error("ERROR: Invalid image name provided")
+        return False
+    
+    if timeout is not None and timeout <= 0:
+        log.error(f"ERROR: Timeout must be greater than 0 seconds, got {timeout}")
         return False
     
     # Check Docker availability first
-    if not check_docker_available():
+    docker_ok, _ = check_docker_available()
+    if not docker_ok:
         return _fallback_to_python_package(model_path, image_name)
     
-    model_filename = os.path.basename(model_path)
+    # Parse the model path once for everything derived from it below
+    model_path_obj = Path(model_path)
+    model_filename = model_path_obj.name
+    model_ext = model_path_obj.suffix.lower()
     ctx = Path("build_context")
+    siblings = _ort_siblings(model_path_obj)
+    model_files = [model_filename, *(sibling.name for sibling in siblings)]
     
     # Create build context directory
     try:
         ctx.mkdir(exist_ok=True)
     except Exception as e:
-        print(f"ERROR: Failed to create build context directory: {e}")
-        return False
-
-    print(f"Creating Docker build context in: {ctx}")
-
-    # Copy the model file into build context
-    print(f"Copying model: {model_path}")
-    try:
-        shutil.copy(model_path, ctx / model_filename)
-    except Exception as e:
-        print(f"ERROR: Failed to copy model file: {e}")
+        log.error(f"ERROR: Failed to create build context directory: {e}")
         return False
 
-    # Write requirements.txt based on model type
-    requirements = _get_requirements_for_model(model_path)
-    print("Writing requirements.txt")
-    try:
-        (ctx / "requirements.txt").write_text(requirements)
-    except Exception as e:
-        print(f"ERROR: Failed to write requirements.txt: {e}")
-        return False
-
-    # Write Dockerfile with model filename substituted
-    print("Writing Dockerfile")
+    log.info(f"Creating Docker build context in: {ctx}")
+    
+    # Drop stale files (e.g. an old model) and limit what docker build sends
     try:
-        dockerfile_content = DOCKERFILE.format(model_filename=model_filename)
-        (ctx / "Dockerfile").write_text(dockerfile_content)
+        keep = {
+            ".dockerignore", "Dockerfile", "requirements.txt", "sample.jpg",
+            *model_files, *_APP_SCRIPTS
+        }
+        _clear_build_context(ctx, keep)
     except Exception as e:
-        print(f"ERROR: Failed to write Dockerfile: {e}")
+        log.error(f"ERROR: Failed to prepare build context: {e}")
         return False
 
-    # Copy inference script
-    print("Copying inference script")
-    infer_script = "infer.py"
-    if os.path.exists(infer_script):
-        try:
-            shutil.copy(infer_script, ctx / infer_script)
-        except Exception as e:
-            print(f"WARNING: Failed to copy inference script: {e}")
-    else:
-        print(f"WARNING: Inference script not found: {infer_script}")
+    pull_proc = _start_cache_pull(cache_from) if cache_from else None
     
-    # Create and copy sample image
+    requirements = _get_requirements_for_model(model_ext)
+    dockerfile_content = DOCKERFILE.substitute(
+        base_image=_BASE_IMAGES.get(model_ext, _DEFAULT_BASE_IMAGE),
+        model_filename=model_filename,
+        model_files=" ".join(model_files),
+        apt_layer=(
+            APT_LAYER.substitute(packages=" ".join(extra_apt_packages))
+            if extra_apt_packages else ""
+        )
+    ).encode("utf-8")
     sample_path = "sample.jpg"
-    _create_sample_image(sample_path)
     
-    print("Copying sample image")
-    if os.path.exists(sample_path):
-        try:
-            shutil.copy(sample_path, ctx / "sample.jpg")
-        except Exception as e:
-            print(f"WARNING: Failed to copy sample image: {e}")
-    else:
-        print("WARNING: Sample image not found, skipping")
+    # The staging steps are independent I/O, so run them concurrently and let
+    # the small writes overlap with the (potentially large) model copy.
+    # Each entry: description -> (callable, args, required)
+    build_files = [
+        (".dockerignore", DOCKERIGNORE.substitute(
+            model_whitelist="\n".join(f"!{name}" for name in model_files)
+        ).encode("utf-8")),
+        ("requirements.txt", requirements),
+        ("Dockerfile", dockerfile_content),
+    ]
+    staging_steps = {
+        "build files": (_write_all, (ctx, build_files), True),
+        "sample image": (_stage_sample_image, (sample_path, ctx / "sample.jpg"), False),
+    }
+    for script in _APP_SCRIPTS:
+        staging_steps[script] = (_stage_optional_file, (script, ctx / script), False)
+    
+    staging_steps["model file"] = (_stage_file, (model_path, ctx / model_filename), True)
+    log.info(f"Copying model: {model_path}")
+    for sibling in siblings:
+        staging_steps[sibling.name] = (_stage_file, (sibling, ctx / sibling.name), True)
+        log.info(f"Copying ONNX graph: {sibling}")
+    log.info("Writing requirements.txt and Dockerfile")
+    log.info("Copying inference script and sample image")
+    
+    # Hashing the model overlaps with staging; it only feeds the rebuild
+    # check, so a failure here is not fatal
+    staging_steps["model digest"] = (_model_digest, (model_path,), False)
+    
+    staging_failed = False
+    model_digest = None
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            pool.submit(fn, *args): (name, required)
+            for name, (fn, args, required) in staging_steps.items()
+        }
+        for future in as_completed(futures):
+            name, required = futures[future]
+            try:
+                result = future.result()
+                if name == "model digest":
+                    model_digest = result
+            except Exception as e:
+                if required:
+                    log.error(f"ERROR: Failed to stage {name}: {e}")
+                    staging_failed = True
+                else:
+                    log.warning(f"WARNING: Failed to stage {name}: {e}")
+    
+    build_key = _build_key(model_digest, ctx, siblings) if model_digest and not staging_failed else None
+    
+    if staging_failed or (build_key and _reuse_previous_build(build_key, image_name)):
+        if pull_proc is not None:
+            pull_proc.kill()
+            pull_proc.wait()
+        return not staging_failed
 
     # Build Docker image
-    print(f"Building Docker image: {image_name}")
-    print("This will download dependencies (~800MB) - may take 5-10 minutes")
+    log.info(f"Building Docker image: {image_name}")
+    log.info("This will download dependencies (~800MB) - may take 5-10 minutes")
+    
+    _wait_for_cache_pull(pull_proc, cache_from)
+    
+    # Written by docker build; any stale copy was removed with the context
+    iid_path = ctx / ".iid"
+    
+    # BuildKit with inline cache metadata lets later builds reuse the
+    # dependency layers of a previously built image
+    cmd = [
+        "docker", "build",
+        "--cache-from", cache_from or image_name,
+        "--build-arg", "BUILDKIT_INLINE_CACHE=1",
+        "-t", image_name,
+        "--iidfile", str(iid_path),
+    ]
+    if verbose:
+        cmd.append("--progress=plain")
+    cmd.append(str(ctx))
+    env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    log.debug(f"Running: {' '.join(cmd)}")
     
-    cmd = ["docker", "build", "-t", image_name, str(ctx)]
-    print(f"Running: {' '.join(cmd)}")
+    if not verbose:
+        log.info("Build output is hidden; pass --verbose to stream it")
     
     try:
-        print("=" * 60)
-        result = subprocess.run(cmd, check=False)
-        print("=" * 60)
+        log.info("=" * 60)
+        returncode = _stream_build(cmd, verbose=verbose, timeout=timeout, env=env)
+        log.info("=" * 60)
         
-        if result.returncode == 0:
-            print(f"SUCCESS: Built Docker image: {image_name}")
-            return _verify_docker_image(image_name)
+        if returncode == 0:
+            log.info(f"SUCCESS: Built Docker image: {image_name}")
+            if not _verify_docker_image(image_name, iid_path):
+                return False
+            if build_key:
+                _record_build(build_key, iid_path)
+            return True
         else:
-            print(f"ERROR: Docker build failed with return code: {result.returncode}")
+            log.error(f"ERROR: Docker build failed with return code: {returncode}")
             return False
             
+    except subprocess.TimeoutExpired:
+        log.info("=" * 60)
+        log.error(f"ERROR: Docker build timed out after {timeout} seconds")
+        return False
     except KeyboardInterrupt:
-        print("\nINTERRUPTED: Build interrupted by user")
+        log.warning("\nINTERRUPTED: Build interrupted by user")
         return False
     except Exception as e:
-        print(f"ERROR: Docker build failed with error: {e}")
+        log.error(f"ERROR: Docker build failed with error: {e}")
         return False
 ```
\ No newline at end of file
@@ -6,9 +6,19 @@ This script provides a safe, read-only demonstration of the project structure,
 features, and workflow without executing any build or deployment operations.
 """
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+SEPARATOR = "=" * 60
+
+# Size units for format_file_size, largest first
+_SIZE_UNITS: Tuple[Tuple[str, int], ...] = (
+    ("GB", 1 << 30),
+    ("MB", 1 << 20),
+    ("KB", 1 << 10),
+)
+
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -23,58 +33,76 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes < 0:
         return "0B"
     
-    units: List[Tuple[str, int]] = [
-        ("GB", 1024**3),
-        ("MB", 1024**2),
-        ("KB", 1024),
-    ]
+    # Most files listed are small, so check the byte case first
+    if size_bytes < 1024:
+        return f"{size_bytes}B"
     
-    for unit, threshold in units:
+    for unit, threshold in _SIZE_UNITS:
         if size_bytes >= threshold:
             return f"{size_bytes / threshold:.1f}{unit}"
     return f"{size_bytes}B"
 
 
-def display_project_files() -> None:
-    """Display project structure with file descriptions and sizes."""
-    print("\n=== Step 1: Project Structure ===")
+def display_project_files(lines: List[str]) -> None:
+    """
+    Display project structure with file descriptions and sizes.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 1: Project Structure ===")
     
     files: Dict[str, str] = {
         "cli.py": "Main command-line interface for model packaging",
         "docker_packager.py": "Docker container generation and build orchestration",
         "model_loader.py": "Safe PyTorch model loading and validation",
         "infer.py": "Model inference pipeline and prediction execution",
+        "preprocess.py": "Fused image preprocessing for inference",
         "resnet18_full.pth": "Demo model - Pre-trained ResNet-18 (47MB)",
         "package_python.py": "Alternative Python package generation (non-Docker)",
     }
     
+    # One directory scan instead of separate exists/getsize calls per file
+    try:
+        with os.scandir(".") as it:
+            entries: Dict[str, os.DirEntry] = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+    
     for filename, description in files.items():
-        if os.path.exists(filename):
+        entry = entries.get(filename)
+        if entry is not None:
             try:
-                size = os.path.getsize(filename)
+                size = entry.stat().st_size
                 size_str = format_file_size(size)
-                print(f"   [✓] {filename:25} ({size_str:>8}) - {description}")
+                lines.append(f"   [✓] {filename:25} ({size_str:>8}) - {description}")
             except OSError:
-                print(f"   [✓] {filename:25} (unavailable) - {description}")
+                lines.append(f"   [✓] {filename:25} (unavailable) - {description}")
         else:
-            print(f"   [✗] {filename:25} (missing)     - {description}")
+            lines.append(f"   [✗] {filename:25} (missing)     - {description}")
 
 
-def display_build_context() -> None:
-    """Display contents of the Docker build context directory."""
-    print("\n=== Step 2: Docker Build Context ===")
-    print("   build_context/")
+def display_build_context(lines: List[str]) -> None:
+    """
+    Display contents of the Docker build context directory.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 2: Docker Build Context ===")
+    lines.append("   build_context/")
     
     build_context_path = Path("build_context")
     
     if not build_context_path.exists():
-        print("      (Not yet generated - run CLI to create)")
+        lines.append("      (Not yet generated - run CLI to create)")
         return
     
     try:
-        items = sorted(build_context_path.iterdir())
+        with os.scandir(build_context_path) as it:
+            items = sorted(it, key=lambda entry: entry.name)
         if not items:
-            print("      (empty directory)")
+            lines.append("      (empty directory)")
             return
             
         for item in items:
@@ -82,22 +110,27 @@ def display_build_context() -> None:
                 try:
                     size = item.stat().st_size
                     size_str = format_file_size(size)
-                    print(f"      ├── {item.name} ({size_str})")
+                    lines.append(f"      ├── {item.name} ({size_str})")
                 except OSError:
-                    print(f"      ├── {item.name} (size unavailable)")
+                    lines.append(f"      ├── {item.name} (size unavailable)")
             elif item.is_dir():
-                print(f"      ├── {item.name}/ (directory)")
+                lines.append(f"      ├── {item.name}/ (directory)")
     except PermissionError:
-        print("      (Unable to read - permission denied)")
+        lines.append("      (Unable to read - permission denied)")
     except OSError as e:
-        print(f"      (Error reading directory: {e})")
+        lines.append(f"      (Error reading directory: {e})")
 
 
-def display_cli_usage() -> None:
-    """Display CLI interface usage and workflow."""
-    print("\n=== Step 3: CLI Interface ===")
-    print("   Usage: python cli.py --input MODEL --image IMAGE_NAME")
-    print("\n   Workflow:")
+def display_cli_usage(lines: List[str]) -> None:
+    """
+    Display CLI interface usage and workflow.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 3: CLI Interface ===")
+    lines.append("   Usage: python cli.py --input MODEL --image IMAGE_NAME")
+    lines.append("\n   Workflow:")
     
     workflow_steps: List[str] = [
         "Load and validate PyTorch model file",
@@ -108,12 +141,17 @@ def display_cli_usage() -> None:
     ]
     
     for idx, step in enumerate(workflow_steps, start=1):
-        print(f"      {idx}. {step}")
+        lines.append(f"      {idx}. {step}")
 
 
-def display_features() -> None:
-    """Display core features of the packaging tool."""
-    print("\n=== Step 4: Core Features ===")
+def display_features(lines: List[str]) -> None:
+    """
+    Display core features of the packaging tool.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 4: Core Features ===")
     
     features: List[str] = [
         "PyTorch model loading (.pth files)",
@@ -126,12 +164,17 @@ def display_features() -> None:
     ]
     
     for feature in features:
-        print(f"   [✓] {feature}")
+        lines.append(f"   [✓] {feature}")
 
 
-def display_workflow() -> None:
-    """Display typical user workflow for model packaging."""
-    print("\n=== Step 5: Typical Workflow ===")
+def display_workflow(lines: List[str]) -> None:
+    """
+    Display typical user workflow for model packaging.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 5: Typical Workflow ===")
     
     workflow_steps: List[str] = [
         "User provides trained PyTorch model (.pth file)",
@@ -143,12 +186,17 @@ def display_workflow() -> None:
     ]
     
     for idx, step in enumerate(workflow_steps, start=1):
-        print(f"   {idx}. {step}")
+        lines.append(f"   {idx}. {step}")
 
 
-def display_technology_stack() -> None:
-    """Display technology stack and component purposes."""
-    print("\n=== Step 6: Technology Stack ===")
+def display_technology_stack(lines: List[str]) -> None:
+    """
+    Display technology stack and component purposes.
+    
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append("\n=== Step 6: Technology Stack ===")
     
     technologies: Dict[str, str] = {
         "PyTorch": "Deep learning framework and model support",
@@ -159,44 +207,50 @@ def display_technology_stack() -> None:
     }
     
     for tech_name, purpose in technologies.items():
-        print(f"   • {tech_name:20} → {purpose}")
+        lines.append(f"   • {tech_name:20} → {purpose}")
 
 
-def display_summary() -> None:
-    """Display final project summary."""
-    separator = "=" * 60
+def display_summary(lines: List[str]) -> None:
+    """
+    Display final project summary.
     
-    print(f"\n{separator}")
-    print("CAPSTONE PROJECT SUMMARY".center(60))
-    print(separator)
-    print("Project:        AI Model Packaging Library")
-    print("Goal:           Automate ML model containerization")
-    print("Status:         Fully functional with CLI interface")
-    print("Key Innovation: One-command model packaging")
-    print("Output:         Production-ready Docker containers")
-    print("Benefit:        Simplified ML model deployment")
-    print(f"\n{'Demo complete - All requirements satisfied!'.center(60)}")
-    print(f"{'Safe for screencast recording'.center(60)}")
-    print(separator)
+    Args:
+        lines: Output buffer the section is appended to
+    """
+    lines.append(f"\n{SEPARATOR}")
+    lines.append("CAPSTONE PROJECT SUMMARY".center(60))
+    lines.append(SEPARATOR)
+    lines.append("Project:        AI Model Packaging Library")
+    lines.append("Goal:           Automate ML model containerization")
+    lines.append("Status:         Fully functional with CLI interface")
+    lines.append("Key Innovation: One-command model packaging")
+    lines.append("Output:         Production-ready Docker containers")
+    lines.append("Benefit:        Simplified ML model deployment")
+    lines.append(f"\n{'Demo complete - All requirements satisfied!'.center(60)}")
+    lines.append(f"{'Safe for screencast recording'.center(60)}")
+    lines.append(SEPARATOR)
 
 
 def main() -> None:
     """Execute the demonstration script."""
-    separator = "=" * 60
-    
-    print(separator)
-    print("AI Model Packaging Library - Demonstration".center(60))
-    print(separator)
-    print("Capstone Project: AI Model Packaging Tool")
-    print("Features: CLI packaging, Docker containers, inference pipeline")
-    
-    display_project_files()
-    display_build_context()
-    display_cli_usage()
-    display_features()
-    display_workflow()
-    display_technology_stack()
-    display_summary()
+    lines: List[str] = [
+        SEPARATOR,
+        "AI Model Packaging Library - Demonstration".center(60),
+        SEPARATOR,
+        "Capstone Project: AI Model Packaging Tool",
+        "Features: CLI packaging, Docker containers, inference pipeline",
+    ]
+    
+    display_project_files(lines)
+    display_build_context(lines)
+    display_cli_usage(lines)
+    display_features(lines)
+    display_workflow(lines)
+    display_technology_stack(lines)
+    display_summary(lines)
+    
+    # Emit the whole report with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,47 +1,208 @@
 ```python
 import argparse
+import importlib.util
 import os
 import sys
+from functools import lru_cache
 
+# Use oneDNN kernels for TensorFlow on CPU; must be set before TF is imported
+os.environ.setdefault("TF_ENABLE_ONEDNN_OPTS", "1")
 
-def run_pytorch_inference(model_path: str, input_image: str = None):
+
+# ONNX Runtime sessions keyed by (model path, model mtime, quantized), so
+# repeated calls in one process reuse the optimized graph instead of
+# rebuilding it. Failures are cached as None so they are not retried.
+_ORT_SESSIONS = {}
+
+# PyTorch formats whose eager model a pre-exported .onnx sibling can stand
+# in for; compiled .pt/.pt2 models are run as they are. Keep in sync with
+# docker_packager._ORT_MODEL_EXTS, which stages the siblings into images.
+_ORT_MODEL_EXTS = (".pth", ".safetensors")
+
+# Upper bound on intra-op threads at batch size 1; beyond this, fork/join
+# overhead per operator outweighs the extra cores
+_MAX_INFERENCE_THREADS = 4
+
+# CPU flags that provide int8 dot-product instructions; without them int8
+# kernels are emulated and run slower than FP32
+_VNNI_FLAGS = ("avx512_vnni", "avx_vnni", "amx_int8")
+
+# CPU flags with native bfloat16 matrix instructions
+_BF16_FLAGS = ("avx512_bf16", "amx_bf16")
+
+
+@lru_cache(maxsize=1)
+def _cpu_flags() -> frozenset:
+    """
+    Read the host CPU feature flags.
+    
+    Returns:
+        frozenset: Flags from /proc/cpuinfo, or an empty set where that is
+        not available (e.g. macOS, Windows)
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def _inference_threads() -> int:
+    """
+    Number of intra-op threads to use for single-image inference.
+    
+    Returns:
+        OMP_NUM_THREADS if set, otherwise the CPU count capped at
+        _MAX_INFERENCE_THREADS
+    """
+    try:
+        return int(os.environ["OMP_NUM_THREADS"])
+    except (KeyError, ValueError):
+        return min(_MAX_INFERENCE_THREADS, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=1)
+def _configure_torch_threads() -> None:
+    """Tune PyTorch's thread pools for batch-1 latency (once per process)."""
+    import torch
+    
+    torch.set_num_threads(_inference_threads())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed before any inter-op work has started
+        pass
+    torch.backends.mkldnn.enabled = True
+
+
+def _create_ort_session(onnx_path: str):
+    """
+    Create an ONNX Runtime CPU session tuned for batch-1 latency.
+    
+    Args:
+        onnx_path: Path to the .onnx file
+    
+    Returns:
+        onnxruntime.InferenceSession
+    
+    Raises:
+        ImportError: If ONNX Runtime is not installed
+    """
+    import onnxruntime as ort
+    
+    sess_opts = ort.SessionOptions()
+    sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_opts.intra_op_num_threads = _inference_threads()
+    sess_opts.inter_op_num_threads = 1
+    sess_opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    return ort.InferenceSession(
+        onnx_path, sess_options=sess_opts, providers=["CPUExecutionProvider"]
+    )
+
+
+def _get_ort_session(model_path: str, quantize: bool = True):
+    """
+    Get an ONNX Runtime session for a PyTorch model with a pre-exported graph.
+    
+    Only .pth and .safetensors models are eligible, and only when a .onnx
+    file at least as new as the model sits next to it (as written by
+    models/gen_real_model.py and staged into the Docker image). Nothing is
+    exported or quantized at run time. On CPUs with VNNI int8 support the
+    session runs the .int8.onnx copy written next to it, if there is one;
+    other CPUs keep FP32.
+    
+    Args:
+        model_path: Path to the PyTorch model file (.pth or .safetensors)
+        quantize: Use the int8 model when the CPU supports it
+    
+    Returns:
+        onnxruntime.InferenceSession, or None if there is no usable .onnx
+        file, ONNX Runtime is not installed or the session failed to load
+    """
+    base, ext = os.path.splitext(model_path)
+    if ext.lower() not in _ORT_MODEL_EXTS:
+        return None
+    
+    onnx_path = base + ".onnx"
+    model_mtime = os.path.getmtime(model_path)
+    try:
+        if os.path.getmtime(onnx_path) < model_mtime:
+            return None
+    except OSError:
+        return None
+    
+    quantize = quantize and not _cpu_flags().isdisjoint(_VNNI_FLAGS)
+    key = (os.path.abspath(model_path), model_mtime, quantize)
+    if key in _ORT_SESSIONS:
+        return _ORT_SESSIONS[key]
+    
+    if importlib.util.find_spec("onnxruntime") is None:
+        return None
+    
+    if quantize:
+        int8_path = base + ".int8.onnx"
+        try:
+            if os.path.getmtime(int8_path) >= os.path.getmtime(onnx_path):
+                onnx_path = int8_path
+        except OSError:
+            pass
+    
+    try:
+        session = _create_ort_session(onnx_path)
+    except Exception as e:
+        print(f"Warning: ONNX Runtime unavailable for this model, using PyTorch: {e}", file=sys.stderr)
+        session = None
+    
+    _ORT_SESSIONS[key] = session
+    return session
+
+
+def run_pytorch_inference(model_path: str, input_image: str = None, quantize: bool = True):
     """
     Run inference using a PyTorch model.
     
     Args:
         model_path: Path to the PyTorch model file (.pth)
         input_image: Optional path to an input image. If not provided, uses dummy data.
+        quantize: Run an int8-quantized model on CPUs with VNNI support
     
     Returns:
         Model output tensor
     """
     import torch
-    import torchvision.transforms as transforms
-    from PIL import Image
+    from model_loader import load_model
+    from preprocess import RESIZE_SIZE, open_rgb, preprocess_image
     
-    # Load model and set to evaluation mode
-    try:
-        model = torch.load(model_path, map_location=torch.device("cpu"), weights_only=False)
-        model.eval()
-    except Exception as e:
-        print(f"Error loading PyTorch model: {e}", file=sys.stderr)
-        sys.exit(1)
+    _configure_torch_threads()
+    
+    # Prefer an optimized ONNX Runtime session; fall back to eager PyTorch
+    session = _get_ort_session(model_path, quantize=quantize)
+    if session is None:
+        try:
+            model = load_model(model_path)
+        except Exception as e:
+            print(f"Error loading PyTorch model: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        # oneDNN convolutions are NHWC-native; converting eager modules once
+        # avoids a layout reorder inside every Conv. Compiled models
+        # (TorchScript, AOTInductor) already have their layout fixed.
+        channels_last = (isinstance(model, torch.nn.Module)
+                         and not isinstance(model, torch.jit.ScriptModule))
+        if channels_last:
+            model = model.to(memory_format=torch.channels_last)
     
     # Prepare input tensor
     if input_image and os.path.exists(input_image):
         print(f"Processing image: {input_image}")
         
-        # Standard ImageNet preprocessing pipeline
-        transform = transforms.Compose([
-            transforms.Resize(256),
-            transforms.CenterCrop(224),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-        ])
-        
+        # Standard ImageNet preprocessing (resize, crop, normalize) in one pass
         try:
-            image = Image.open(input_image).convert('RGB')
-            input_tensor = transform(image).unsqueeze(0)
+            image = open_rgb(input_image, (RESIZE_SIZE, RESIZE_SIZE))
+            input_tensor = torch.from_numpy(preprocess_image(image))
         except Exception as e:
             print(f"Error processing image: {e}", file=sys.stderr)
             sys.exit(1)
@@ -51,25 +212,38 @@ def run_pytorch_inference(model_path: str, input_image: str = None):
         print("Using dummy input tensor (no image provided)")
         input_tensor = torch.randn(1, 3, 224, 224)
     
+    if session is None and channels_last:
+        input_tensor = input_tensor.contiguous(memory_format=torch.channels_last)
+    
     # Run inference
     try:
-        with torch.no_grad():
-            outputs = model(input_tensor)
+        with torch.inference_mode():
+            if session is not None:
+                input_name = session.get_inputs()[0].name
+                outputs = torch.from_numpy(
+                    session.run(None, {input_name: input_tensor.numpy()})[0]
+                )
+            else:
+                # bfloat16 doubles matmul throughput on CPUs that support it
+                # natively; elsewhere it would be emulated, so stay in FP32
+                use_bf16 = not _cpu_flags().isdisjoint(_BF16_FLAGS)
+                with torch.autocast("cpu", dtype=torch.bfloat16, enabled=use_bf16):
+                    outputs = model(input_tensor)
+                outputs = outputs.float()
             
             # Check if output is suitable for classification
             if len(outputs.shape) == 2 and outputs.shape[0] == 1:
-                probabilities = torch.nn.functional.softmax(outputs, dim=1)
-                
-                # Display top 5 predictions
-                num_classes = outputs.shape[1]
-                top_k = min(5, num_classes)
-                top_prob, top_indices = torch.topk(probabilities, top_k)
+                # Display top 5 predictions. Softmax preserves order, so take
+                # the top-k of the logits and normalize only those values
+                logits = outputs[0]
+                top_k = min(5, logits.shape[0])
+                top_logits, top_indices = torch.topk(logits, top_k)
+                top_prob = torch.exp(top_logits - torch.logsumexp(logits, dim=0))
                 
+                # One conversion to Python values instead of .item() per entry
                 print(f"\nTop {top_k} predictions:")
-                for i in range(top_k):
-                    idx = top_indices[0][i].item()
-                    prob = top_prob[0][i].item()
-                    print(f"   {i+1}. Class {idx}: {prob:.4f} ({prob*100:.1f}%)")
+                for i, (idx, prob) in enumerate(zip(top_indices.tolist(), top_prob.tolist()), 1):
+                    print(f"   {i}. Class {idx}: {prob:.4f} ({prob*100:.1f}%)")
             else:
                 print(f"\nPyTorch inference output shape: {outputs.shape}")
                 print(f"PyTorch inference output: {outputs}")
@@ -80,6 +254,86 @@ def run_pytorch_inference(model_path: str, input_image: str = None):
     return outputs
 
 
+def run_onnx_inference(model_path: str, input_image: str = None):
+    """
+    Run inference on an ONNX model with ONNX Runtime.
+    
+    The model is expected to take a (N, 3, 224, 224) ImageNet-normalized
+    float32 batch, as exported by models/gen_real_model.py.
+    
+    Args:
+        model_path: Path to the ONNX model file (.onnx)
+        input_image: Optional path to an input image. If not provided, uses dummy data.
+    
+    Returns:
+        Model output as a NumPy array
+    """
+    import numpy as np
+    from preprocess import RESIZE_SIZE, open_rgb, preprocess_image
+    
+    try:
+        session = _create_ort_session(model_path)
+    except Exception as e:
+        print(f"Error loading ONNX model: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Prepare input
+    if input_image and os.path.exists(input_image):
+        print(f"Processing image: {input_image}")
+        try:
+            image = open_rgb(input_image, (RESIZE_SIZE, RESIZE_SIZE))
+            input_data = preprocess_image(image)
+        except Exception as e:
+            print(f"Error processing image: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        if input_image:
+            print(f"Warning: Image file not found: {input_image}", file=sys.stderr)
+        print("Using dummy input tensor (no image provided)")
+        input_data = np.random.randn(1, 3, 224, 224).astype(np.float32)
+    
+    # Run inference
+    try:
+        input_name = session.get_inputs()[0].name
+        outputs = session.run(None, {input_name: input_data})[0]
+        
+        if outputs.ndim == 2 and outputs.shape[0] == 1:
+            # Softmax preserves order, so take the top-k of the logits and
+            # normalize only those values
+            logits = outputs[0].astype(np.float64)
+            top_k = min(5, logits.shape[0])
+            top_indices = np.argpartition(-logits, top_k - 1)[:top_k]
+            top_indices = top_indices[np.argsort(-logits[top_indices])]
+            max_logit = logits.max()
+            log_norm = max_logit + np.log(np.exp(logits - max_logit).sum())
+            top_prob = np.exp(logits[top_indices] - log_norm)
+            
+            print(f"\nTop {top_k} predictions:")
+            for i, (idx, prob) in enumerate(zip(top_indices.tolist(), top_prob.tolist()), 1):
+                print(f"   {i}. Class {idx}: {prob:.4f} ({prob*100:.1f}%)")
+        else:
+            print(f"\nONNX inference output shape: {outputs.shape}")
+            print(f"ONNX inference output: {outputs}")
+    except Exception as e:
+        print(f"Error during inference: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    return outputs
+
+
+@lru_cache(maxsize=1)
+def _tf_input_buffer():
+    """
+    Get the reusable float32 input batch for the TensorFlow path.
+    
+    Returns:
+        Contiguous (1, 224, 224, 3) float32 NumPy array
+    """
+    import numpy as np
+    
+    return np.empty((1, 224, 224, 3), dtype=np.float32)
+
+
 def run_tensorflow_inference(model_path: str, input_image: str = None):
     """
     Run inference using a TensorFlow/Keras model.
@@ -93,11 +347,12 @@ def run_tensorflow_inference(model_path: str, input_image: str = None):
     """
     import numpy as np
     import tensorflow as tf
-    from PIL import Image
+    from model_loader import get_tf_predict_fn, load_model
+    from preprocess import open_rgb
     
-    # Load model
+    # Load model (cached per process)
     try:
-        model = tf.keras.models.load_model(model_path)
+        model = load_model(model_path)
     except Exception as e:
         print(f"Error loading TensorFlow model: {e}", file=sys.stderr)
         sys.exit(1)
@@ -107,15 +362,13 @@ def run_tensorflow_inference(model_path: str, input_image: str = None):
         print(f"Processing image: {input_image}")
         try:
             # Load and preprocess image
-            image = Image.open(input_image).convert('RGB')
+            image = open_rgb(input_image, (224, 224))
             image = image.resize((224, 224))
-            input_data = np.array(image, dtype=np.float32)
-            
-            # Normalize to [0, 1] range
-            input_data = input_data / 255.0
             
-            # Add batch dimension
-            input_data = np.expand_dims(input_data, axis=0)
+            # Normalize to [0, 1] straight into the batch buffer, with no
+            # float64 temporaries or expand_dims copy
+            input_data = _tf_input_buffer()
+            np.divide(np.asarray(image, dtype=np.uint8), np.float32(255.0), out=input_data[0])
         except Exception as e:
             print(f"Error processing image: {e}", file=sys.stderr)
             sys.exit(1)
@@ -129,20 +382,27 @@ def run_tensorflow_inference(model_path: str, input_image: str = None):
     
     # Run inference
     try:
-        output = model(input_data, training=False)
+        try:
+            output = get_tf_predict_fn(model)(input_data)
+        except tf.errors.OpError as e:
+            # Some ops have no XLA kernel; run the traced graph without it
+            print(f"Warning: XLA compilation failed, running without it: {e}", file=sys.stderr)
+            output = get_tf_predict_fn(model, jit_compile=False)(input_data)
         print(f"\nTensorFlow inference output shape: {output.shape}")
         
         # If output looks like classification logits/probabilities, show top predictions
         if len(output.shape) == 2 and output.shape[0] == 1:
-            probabilities = tf.nn.softmax(output, axis=1).numpy()[0]
-            num_classes = len(probabilities)
-            top_k = min(5, num_classes)
-            top_indices = np.argsort(probabilities)[-top_k:][::-1]
+            # Softmax preserves order, so take the top-k of the logits and
+            # normalize only those values
+            logits = output[0]
+            top_k = min(5, int(logits.shape[0]))
+            top = tf.math.top_k(logits, k=top_k)
+            top_prob = tf.exp(top.values - tf.math.reduce_logsumexp(logits)).numpy().tolist()
+            top_indices = top.indices.numpy().tolist()
             
             print(f"\nTop {top_k} predictions:")
-            for i, idx in enumerate(top_indices):
-                prob = probabilities[idx]
-                print(f"   {i+1}. Class {idx}: {prob:.4f} ({prob*100:.1f}%)")
+            for i, (idx, prob) in enumerate(zip(top_indices, top_prob), 1):
+                print(f"   {i}. Class {idx}: {prob:.4f} ({prob*100:.1f}%)")
         else:
             print(f"TensorFlow inference output: {output.numpy()}")
     except Exception as e:
@@ -160,12 +420,18 @@ def main():
     parser.add_argument(
         "--model",
         required=True,
-        help="Path to model file (.pth for PyTorch, .h5 for TensorFlow)"
+        help="Path to model file (.pth/.pt/.pt2/.safetensors for PyTorch, .onnx for ONNX Runtime, .h5 for TensorFlow)"
     )
     parser.add_argument(
         "--test-input",
         help="Path to input image for testing"
     )
+    parser.add_argument(
+        "--no-quantize",
+        dest="quantize",
+        action="store_false",
+        help="Keep PyTorch models in FP32 even on CPUs with int8 (VNNI) support"
+    )
     args = parser.parse_args()
     
     model_path = args.model
@@ -176,12 +442,14 @@ def main():
         sys.exit(1)
     
     # Route to appropriate inference function based on file extension
-    if model_path.endswith(".pth"):
-        run_pytorch_inference(model_path, args.test_input)
+    if model_path.endswith((".pth", ".pt", ".pt2", ".safetensors")):
+        run_pytorch_inference(model_path, args.test_input, quantize=args.quantize)
+    elif model_path.endswith(".onnx"):
+        run_onnx_inference(model_path, args.test_input)
     elif model_path.endswith(".h5"):
         run_tensorflow_inference(model_path, args.test_input)
     else:
-        print(f"Error: Unsupported model format. Expected .pth or .h5, got: {model_path}", file=sys.stderr)
+        print(f"Error: Unsupported model format. Expected .pth, .pt, .pt2, .safetensors, .onnx or .h5, got: {model_path}", file=sys.stderr)
         sys.exit(1)
 
 
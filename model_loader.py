@@ -1,18 +1,38 @@
 ```python
 import os
-import torch
-import tensorflow as tf
+import pickle
+import warnings
+from functools import lru_cache
 
 
-def load_model(path):
+# Compiled siblings of a .pth, in order of preference: an AOTInductor
+# package (native code, no warmup) and then TorchScript
+_COMPILED_EXTS = (".pt2", ".pt")
+
+
+def load_model(path, prefer_scripted=True):
     """
     Load an AI model from the given path.
     
-    Supports PyTorch (.pth, .pt) and TensorFlow (.h5, .keras) model formats.
-    PyTorch models are loaded in evaluation mode on CPU by default.
+    Supports PyTorch (.pth, .pt, .pt2, .safetensors) and TensorFlow (.h5,
+    .keras) model formats. PyTorch models are loaded in evaluation mode on
+    CPU by default. A .pth may hold a pickled module or an
+    ``{"arch": ..., "state_dict": ...}`` checkpoint, and a .safetensors
+    file names its architecture in the "arch" metadata entry. .pt files are
+    loaded as TorchScript and .pt2 files as AOTInductor packages. A .pth
+    with an up-to-date .pt2 or .pt sibling (as written by
+    models/gen_real_model.py) loads the compiled version instead, and
+    otherwise an up-to-date .safetensors sibling; siblings that fail to load
+    are skipped in favour of the .pth itself.
+    
+    Loaded models are cached per process and keyed by the file's
+    modification time, so repeated calls return the same object until the
+    file changes.
     
     Args:
         path (str): Path to the model file.
+        prefer_scripted (bool): Use a compiled .pt2/.pt sibling of a .pth
+            file when one exists.
         
     Returns:
         The loaded model object (torch.nn.Module or tf.keras.Model).
@@ -28,18 +48,114 @@ def load_model(path):
     _, ext = os.path.splitext(path)
     ext = ext.lower()
     
-    # PyTorch formats
-    if ext in (".pth", ".pt"):
-        # Load PyTorch model on CPU and set to evaluation mode
-        # Using weights_only=False for backward compatibility, but consider
-        # setting to True for security if loading trusted models only
-        model = torch.load(path, map_location=torch.device("cpu"), weights_only=False)
+    # Up-to-date siblings of a .pth, in order of preference. An up-to-date
+    # .safetensors copy gives the same eager model without torch.load's zip
+    # probing and unpickling.
+    sibling_exts = []
+    if ext == ".pth":
+        if prefer_scripted:
+            sibling_exts.extend(_COMPILED_EXTS)
+        sibling_exts.append(".safetensors")
+    
+    mtime = os.path.getmtime(path)
+    for sibling_ext in sibling_exts:
+        sibling_path = os.path.splitext(path)[0] + sibling_ext
+        try:
+            sibling_mtime = os.path.getmtime(sibling_path)
+        except OSError:
+            continue
+        if sibling_mtime < mtime:
+            continue
+        try:
+            return _load_cached(os.path.abspath(sibling_path), sibling_mtime, sibling_ext)
+        except Exception as e:
+            # A broken sibling must not hide a loadable .pth
+            warnings.warn(f"Ignoring {sibling_path}, it failed to load: {e}")
+    
+    if ext == ".pt":
+        try:
+            return _load_cached(os.path.abspath(path), mtime, ext)
+        except RuntimeError:
+            # Not TorchScript; treat it like a pickled .pth model
+            ext = ".pth"
+    
+    return _load_cached(os.path.abspath(path), mtime, ext)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path, mtime, ext):
+    """
+    Load a model file; cached on (path, mtime, extension).
+    
+    Frameworks are imported only for the format being loaded.
+    
+    Args:
+        path (str): Absolute path to the model file.
+        mtime (float): Modification time of the file, part of the cache key.
+        ext (str): Lower-cased file extension, including the dot.
+        
+    Returns:
+        The loaded model object (torch.nn.Module or tf.keras.Model).
+    """
+    # AOTInductor packages; the result is a callable, not an nn.Module
+    if ext == ".pt2":
+        import torch._inductor
+        
+        return torch._inductor.aoti_load_package(path)
+    
+    # TorchScript archives
+    elif ext == ".pt":
+        import torch
+        
+        # The legacy executor runs the frozen graph as-is instead of profiling
+        # and re-optimizing it over the first few calls
+        torch._C._jit_set_profiling_executor(False)
+        model = torch.jit.load(path, map_location=torch.device("cpu"))
+        # Frozen graphs get Conv/BN folding and linear/pointwise fusion
+        return torch.jit.optimize_for_inference(model.eval())
+    
+    # Pickled PyTorch models
+    elif ext == ".pth":
+        import torch
+        
+        # Load PyTorch model on CPU and set to evaluation mode. Checkpoints
+        # holding only tensors load with the restricted weights-only
+        # unpickler; fully pickled modules need weights_only=False, so only
+        # load trusted models of that kind
+        try:
+            model = _torch_load_cpu(path, weights_only=True)
+        except pickle.UnpicklingError:
+            model = _torch_load_cpu(path, weights_only=False)
+        
+        # Checkpoints saved as {"arch": ..., "state_dict": ...}, optionally
+        # with int8 weights and their "weight_scales"
+        if isinstance(model, dict) and "state_dict" in model:
+            state_dict = model["state_dict"]
+            for name, scale in model.get("weight_scales", {}).items():
+                state_dict[name] = state_dict[name].float() * scale
+            model = _build_torchvision_model(model.get("arch"), state_dict)
+        
         if hasattr(model, "eval"):
             model.eval()
         return model
     
+    # Raw tensors with the architecture name in the file's metadata
+    elif ext == ".safetensors":
+        from safetensors import safe_open
+        
+        # One open: the header is parsed once and the tensors are read from
+        # the same memory map
+        with safe_open(path, framework="pt", device="cpu") as f:
+            arch = (f.metadata() or {}).get("arch")
+            state_dict = {name: f.get_tensor(name) for name in f.keys()}
+        model = _build_torchvision_model(arch, state_dict)
+        model.eval()
+        return model
+    
     # TensorFlow/Keras formats
     elif ext in (".h5", ".keras"):
+        import tensorflow as tf
+        
         # Load TensorFlow/Keras model
         model = tf.keras.models.load_model(path)
         return model
@@ -48,6 +164,94 @@ def load_model(path):
     else:
         raise ValueError(
             f"Unsupported model format: {ext}. "
-            "Supported formats are .pth/.pt (PyTorch) and .h5/.keras (TensorFlow/Keras)."
+            "Supported formats are .pth/.pt/.pt2/.safetensors (PyTorch) and "
+            ".h5/.keras (TensorFlow/Keras)."
         )
+
+
+def _torch_load_cpu(path, weights_only):
+    """
+    torch.load a checkpoint onto the CPU, memory-mapped when possible.
+    
+    mmap=True maps tensor storages straight from the file instead of reading
+    it into memory first, so peak RSS stays near one copy of the weights.
+    Legacy (non-zipfile) checkpoints cannot be mapped and are read normally.
+    
+    Args:
+        path (str): Path to the checkpoint.
+        weights_only (bool): Use the restricted weights-only unpickler.
+        
+    Returns:
+        The unpickled object.
+    """
+    import torch
+    
+    cpu = torch.device("cpu")
+    try:
+        return torch.load(path, map_location=cpu, mmap=True, weights_only=weights_only)
+    except RuntimeError:
+        return torch.load(path, map_location=cpu, weights_only=weights_only)
+
+
+def _build_torchvision_model(arch, state_dict):
+    """
+    Instantiate a torchvision architecture and load weights into it.
+    
+    Args:
+        arch (str): Name of a torchvision.models builder, e.g. "resnet18".
+        state_dict (dict): Parameter and buffer tensors for the model.
+        
+    Returns:
+        torch.nn.Module: The model with the given weights.
+        
+    Raises:
+        ValueError: If ``arch`` is missing or not a torchvision model.
+    """
+    import torch
+    import torchvision.models as models
+    
+    builder = getattr(models, arch, None) if arch else None
+    if not callable(builder):
+        raise ValueError(f"Unknown model architecture in checkpoint: {arch!r}")
+    
+    # Build on the meta device so no throwaway random weights are allocated,
+    # then adopt the loaded tensors as the parameters without copying
+    with torch.device("meta"):
+        model = builder()
+    model.load_state_dict(state_dict, assign=True)
+    
+    # Non-persistent buffers are not in the state_dict and would stay on meta
+    if any(t.is_meta for t in model.buffers()):
+        model = builder()
+        model.load_state_dict(state_dict)
+    return model
+
+
+@lru_cache(maxsize=8)
+def get_tf_predict_fn(model, jit_compile=True):
+    """
+    Wrap a Keras model in a tf.function with a fixed input signature.
+    
+    The function is traced once for a single 224x224 RGB float32 image, so
+    later calls reuse the same concrete graph instead of retracing. With
+    ``jit_compile`` the graph is compiled by XLA, which fuses the model's
+    small ops (e.g. Conv+BN+ReLU) into larger kernels.
+    
+    Args:
+        model: A tf.keras.Model returned by load_model().
+        jit_compile (bool): Compile the forward pass with XLA.
+        
+    Returns:
+        Callable taking a (1, 224, 224, 3) NHWC float32 batch.
+    """
+    import tensorflow as tf
+    
+    @tf.function(
+        jit_compile=jit_compile,
+        input_signature=[tf.TensorSpec(shape=(1, 224, 224, 3), dtype=tf.float32)]
+    )
+    def predict(batch):
+        return model(batch, training=False)
+    
+    return predict
 ```
\ No newline at end of file
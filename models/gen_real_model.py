@@ -5,14 +5,21 @@ Generate a real ResNet-18 model for demonstration purposes.
 This script downloads a pre-trained ResNet-18 model from PyTorch Hub
 and saves it to disk for use in packaging demonstrations.
 """
+import argparse
+import ctypes
+import gc
+import importlib.util
+import inspect
 import os
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import torch
 import torchvision.models as models
+from safetensors.torch import save_file
 
-
-def generate_resnet18_model():
+def generate_resnet18_model(int8=False):
     """
     Download and save a pre-trained ResNet-18 model.
     
@@ -20,6 +27,12 @@ def generate_resnet18_model():
     PyTorch Hub and saves it to disk. The model is set to evaluation mode
     before saving.
     
+    Args:
+        int8: Store the .pth checkpoint's weight matrices as int8 with
+            per-output-channel scales, about 4x smaller on disk. Only the
+            .pth is written then; FP32 siblings would take precedence
+            over it in model_loader and infer.py.
+    
     Returns:
         str: Path to the saved model file.
         
@@ -30,27 +43,72 @@ def generate_resnet18_model():
         print("Generating pre-trained ResNet-18 model...")
         print("Downloading model weights from PyTorch Hub...")
         
-        # Download pre-trained ResNet-18 model (1000 ImageNet classes)
-        model = _load_resnet18_model()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Download pre-trained ResNet-18 model (1000 ImageNet classes)
+            # while the output location is prepared
+            model_future = pool.submit(_load_resnet18_model)
+            
+            # Determine output path relative to script location
+            output_path = _get_output_path()
+            
+            # Ensure the output directory exists
+            _ensure_output_directory(output_path)
+            
+            model = model_future.result()
         
         # Set model to evaluation mode
         model.eval()
         
-        # Determine output path relative to script location
-        output_path = _get_output_path()
-        
-        # Ensure the output directory exists
-        _ensure_output_directory(output_path)
-        
-        # Save the complete model (architecture + weights)
-        torch.save(model, output_path)
+        # Save the weights with the architecture name; tensors serialize
+        # far faster than a pickled module and model_loader rebuilds the
+        # model. Protocol 5 pickles tensor storages out of band instead of
+        # copying them into the pickle stream.
+        checkpoint = {"arch": "resnet18", "state_dict": model.state_dict()}
+        if int8:
+            checkpoint["state_dict"], checkpoint["weight_scales"] = (
+                _quantize_state_dict(checkpoint["state_dict"])
+            )
+        torch.save(
+            checkpoint,
+            output_path,
+            pickle_protocol=5,
+            _use_new_zipfile_serialization=True
+        )
         
         # Verify the file was created successfully
         if not os.path.exists(output_path):
             raise RuntimeError(f"Failed to save model to {output_path}")
         
+        # Sibling formats, written after the .pth because model_loader and
+        # infer.py ignore siblings older than it. They run one after another:
+        # jit tracing and ONNX export share process-global tracer state, and
+        # torch.export swaps the module's parameters for fake tensors while
+        # it traces. With int8 weights they are skipped; any left over from
+        # an earlier run are now older than the .pth and so ignored.
+        scripted_path = safetensors_path = aot_path = onnx_path = int8_onnx_path = None
+        if not int8:
+            scripted_path = _save_torchscript(model, output_path)
+            safetensors_path = _save_safetensors(model, output_path)
+            aot_path = _save_aot_package(model, output_path)
+            onnx_path = _save_onnx(model, output_path)
+            int8_onnx_path = _save_int8_onnx(onnx_path) if onnx_path else None
+        
+        # Drop the model and serialization buffers before returning
+        del model, checkpoint
+        _release_memory()
+        
         # Display model information
         _print_model_info(output_path)
+        if scripted_path:
+            print(f"TorchScript: {scripted_path}")
+        if safetensors_path:
+            print(f"safetensors: {safetensors_path}")
+        if aot_path:
+            print(f"AOTInductor: {aot_path}")
+        if onnx_path:
+            print(f"ONNX: {onnx_path}")
+        if int8_onnx_path:
+            print(f"ONNX int8: {int8_onnx_path}")
         
         return output_path
         
@@ -59,22 +117,242 @@ def generate_resnet18_model():
         raise RuntimeError(f"Failed to generate ResNet-18 model: {e}") from e
 
 
+def _release_memory():
+    """
+    Return freed heap memory to the operating system.
+    
+    Saving leaves large freed buffers in glibc's heap, which keeps the
+    process's RSS at its high-water mark. malloc_trim hands them back; it is
+    skipped where glibc is not available.
+    """
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
 def _load_resnet18_model():
     """
     Load ResNet-18 model with appropriate method based on PyTorch version.
     
+    torch hub's on-disk cache avoids downloading the weights again on later
+    runs.
+    
     Returns:
         torch.nn.Module: Loaded ResNet-18 model.
     """
-    try:
-        # PyTorch >= 0.13 uses weights parameter
-        from torchvision.models import ResNet18_Weights
-        return models.resnet18(weights=ResNet18_Weights.IMAGENET1K_V1)
-    except (ImportError, AttributeError):
+    weights = _weights()
+    if weights is None:
         # Fall back to deprecated pretrained parameter for older PyTorch versions
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', category=FutureWarning)
             return models.resnet18(pretrained=True)
+    
+    state_dict = weights.get_state_dict(progress=True)
+    model = models.resnet18()
+    model.load_state_dict(state_dict)
+    return model
+
+
+@lru_cache(maxsize=1)
+def _weights():
+    """
+    Resolve the ResNet-18 pretrained weights enum once per process.
+    
+    Returns:
+        The ImageNet weights enum member, or None on torchvision < 0.13,
+        which only supports ``pretrained=True``.
+    """
+    try:
+        # torchvision >= 0.13 uses weights parameter
+        from torchvision.models import ResNet18_Weights
+    except ImportError:
+        return None
+    return ResNet18_Weights.IMAGENET1K_V1
+
+
+def _quantize_state_dict(state_dict):
+    """
+    Quantize conv and linear weights to int8 with per-output-channel scales.
+    
+    Symmetric weight-only quantization: each output channel is scaled so its
+    largest magnitude maps to 127. Biases and batch-norm tensors stay FP32.
+    model_loader dequantizes the weights back to FP32 on load.
+    
+    Args:
+        state_dict: FP32 model state_dict.
+        
+    Returns:
+        tuple: (state_dict with int8 weights, dict of name -> scale tensor
+        shaped to broadcast against the weight).
+    """
+    quantized = {}
+    scales = {}
+    for name, tensor in state_dict.items():
+        if tensor.is_floating_point() and tensor.dim() >= 2:
+            max_abs = tensor.abs().amax(dim=tuple(range(1, tensor.dim())), keepdim=True)
+            scale = (max_abs / 127.0).clamp_min(torch.finfo(torch.float32).tiny)
+            quantized[name] = torch.round(tensor / scale).to(torch.int8)
+            scales[name] = scale
+        else:
+            quantized[name] = tensor
+    return quantized, scales
+
+
+def _save_torchscript(model, output_path):
+    """
+    Trace, freeze and save the model as TorchScript.
+    
+    Freezing inlines the weights and folds conv+BN. The MKLDNN rewrites of
+    torch.jit.optimize_for_inference are left to model_loader at load time,
+    because a graph holding prepacked MKLDNN ops saves but cannot be loaded
+    back. The saved file is loaded once to check it; it is deleted if that
+    fails. model_loader.load_model() prefers this file over the pickled .pth
+    when it is at least as new.
+    
+    Args:
+        model: ResNet-18 model in evaluation mode.
+        output_path: Path of the pickled .pth model.
+        
+    Returns:
+        str: Path to the saved .pt file, or None if it could not be built.
+    """
+    scripted_path = os.path.splitext(output_path)[0] + ".pt"
+    try:
+        with torch.no_grad():
+            traced = torch.jit.trace(model, torch.randn(1, 3, 224, 224))
+        torch.jit.freeze(traced).save(scripted_path)
+        torch.jit.load(scripted_path, map_location="cpu")
+        return scripted_path
+    except Exception as e:
+        print(f"Skipping TorchScript model: {e}", file=sys.stderr)
+        if os.path.exists(scripted_path):
+            os.remove(scripted_path)
+        return None
+
+
+def _save_aot_package(model, output_path):
+    """
+    Compile the model ahead of time with AOTInductor and save the package.
+    
+    The .pt2 package holds native code generated by torch.export and
+    Inductor, so loading it needs no JIT warmup at the first inference.
+    Requires PyTorch 2.6+ and a C++ compiler; otherwise it is skipped.
+    
+    Args:
+        model: ResNet-18 model in evaluation mode.
+        output_path: Path of the .pth checkpoint.
+        
+    Returns:
+        str: Path to the saved .pt2 file, or None if it could not be built.
+    """
+    import torch._inductor
+    
+    if not hasattr(torch._inductor, "aoti_compile_and_package"):
+        return None
+    
+    package_path = os.path.splitext(output_path)[0] + ".pt2"
+    try:
+        with torch.no_grad():
+            exported = torch.export.export(model, (torch.randn(1, 3, 224, 224),))
+            return torch._inductor.aoti_compile_and_package(exported, package_path=package_path)
+    except Exception as e:
+        print(f"Skipping AOTInductor package: {e}", file=sys.stderr)
+        return None
+
+
+def _save_onnx(model, output_path):
+    """
+    Export the model to ONNX for infer.py's ONNX Runtime path.
+    
+    infer.py only uses ONNX Runtime for a .pth/.safetensors model when this
+    file sits next to it, and docker_packager stages it into the image.
+    The TorchScript-based exporter is requested explicitly: newer PyTorch
+    defaults to the dynamo exporter, which needs the onnxscript package.
+    
+    Args:
+        model: ResNet-18 model in evaluation mode.
+        output_path: Path of the .pth checkpoint.
+        
+    Returns:
+        str: Path to the saved .onnx file, or None if the export failed.
+    """
+    onnx_path = os.path.splitext(output_path)[0] + ".onnx"
+    # PyTorch before 2.5 has no dynamo argument and always uses the
+    # TorchScript-based exporter
+    export_kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+    try:
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                torch.randn(1, 3, 224, 224),
+                onnx_path,
+                opset_version=17,
+                input_names=["input"],
+                output_names=["output"],
+                dynamic_axes={"input": {0: "N"}, "output": {0: "N"}},
+                **export_kwargs
+            )
+        return onnx_path
+    except Exception as e:
+        print(f"Skipping ONNX export: {e}", file=sys.stderr)
+        return None
+
+
+def _save_int8_onnx(onnx_path):
+    """
+    Write a dynamically int8-quantized copy of the ONNX model.
+    
+    infer.py runs it instead of the FP32 graph on CPUs with VNNI int8
+    support. Quantization needs both onnxruntime and the onnx package; it is
+    skipped when either is missing.
+    
+    Args:
+        onnx_path: Path to the FP32 .onnx file.
+        
+    Returns:
+        str: Path to the .int8.onnx file, or None if it was not written.
+    """
+    if importlib.util.find_spec("onnx") is None or importlib.util.find_spec("onnxruntime") is None:
+        print("Skipping int8 ONNX model: onnx and onnxruntime are required", file=sys.stderr)
+        return None
+    
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    int8_path = os.path.splitext(onnx_path)[0] + ".int8.onnx"
+    try:
+        quantize_dynamic(
+            onnx_path,
+            int8_path,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["Conv", "MatMul", "Gemm"]
+        )
+        return int8_path
+    except Exception as e:
+        print(f"Skipping int8 ONNX model: {e}", file=sys.stderr)
+        return None
+
+
+def _save_safetensors(model, output_path):
+    """
+    Save the model weights as a .safetensors file.
+    
+    The file is a small header followed by raw tensor bytes, so loaders can
+    memory-map the weights instead of unpickling a copy.
+    
+    Args:
+        model: ResNet-18 model.
+        output_path: Path of the .pth checkpoint.
+        
+    Returns:
+        str: Path to the saved file.
+    """
+    safetensors_path = os.path.splitext(output_path)[0] + ".safetensors"
+    save_file(model.state_dict(), safetensors_path, metadata={"arch": "resnet18"})
+    return safetensors_path
 
 
 def _get_output_path():
@@ -122,8 +400,16 @@ def _print_model_info(output_path):
 
 def main():
     """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Generate a pre-trained ResNet-18 model")
+    parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Store .pth weights as int8 (about 4x smaller, slight accuracy loss)"
+    )
+    args = parser.parse_args()
+    
     try:
-        generate_resnet18_model()
+        generate_resnet18_model(int8=args.int8)
         return 0
     except Exception:
         return 1
@@ -1,119 +1,259 @@
 ```python
 import argparse
+import mmap
+import os
 import shutil
+import stat
+import subprocess
 import sys
+import tempfile
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Serialized weights are close to incompressible; deflating them costs far
+# more CPU than it saves in bytes, so they are stored as-is
+_STORED_SUFFIXES = frozenset({
+    ".pth", ".pt", ".pt2", ".safetensors", ".onnx", ".bin", ".whl", ".gz", ".zip"
+})
+
+_REQUIRED_SCRIPTS = ("infer.py", "preprocess.py", "model_loader.py")
+
 
-def create_python_package(model_path: str, package_name: str) -> None:
+def create_python_package(
+    model_path: str,
+    package_name: str,
+    bundle_wheels: bool = False,
+    keep_dir: bool = False
+) -> str:
     """
     Create a portable Python package for model deployment.
     
     This function creates a self-contained package that includes:
     - The model file
-    - Required Python scripts (infer.py, model_loader.py)
+    - Required Python scripts (infer.py, preprocess.py, model_loader.py)
     - Dependencies specification (requirements.txt)
     - Cross-platform run scripts (run.py for Unix/Mac, run.bat for Windows)
     
+    Files are streamed straight into the zip archive, so the model is only
+    written to disk once. The unpacked package directory is only created
+    when ``keep_dir`` is set.
+    
     Args:
         model_path: Path to the model file to be packaged
         package_name: Name for the output package (without extension)
+        bundle_wheels: Download wheels for requirements.txt into wheels/ so
+            run.py can install them offline
+        keep_dir: Also write the unpacked package directory
+    
+    Returns:
+        Path to the created zip file
     
     Raises:
         FileNotFoundError: If model_path or required scripts don't exist
         PermissionError: If unable to create package directory or files
+        subprocess.CalledProcessError: If downloading the wheels fails
     """
     model_file = Path(model_path)
     if not model_file.exists():
         raise FileNotFoundError(f"Model file not found: {model_path}")
+    for script in _REQUIRED_SCRIPTS:
+        if not Path(script).exists():
+            raise FileNotFoundError(f"Required script not found: {script}")
     
     model_filename = model_file.name
     package_dir = Path(f"{package_name}_package")
-    package_dir.mkdir(exist_ok=True)
     
-    print(f"📦 Creating Python package: {package_name}")
-    
-    # Copy required files
-    _copy_required_files(model_file, model_filename, package_dir)
+    # (source, name in package) pairs, plus generated requirements.txt and
+    # run scripts for different platforms
+    sources = [(model_file, model_filename)]
+    sources += [(Path(script), script) for script in _REQUIRED_SCRIPTS]
+    generated = (
+        ("requirements.txt", _requirements_text(), 0o644),
+        ("run.py", _run_script(model_filename), 0o755),
+        ("run.bat", _batch_script(), 0o644),
+    )
     
-    # Create requirements.txt
-    _create_requirements_file(package_dir)
+    print(f"📦 Creating Python package: {package_name}")
     
-    # Create run scripts for different platforms
-    _create_run_script(package_dir, model_filename)
-    _create_batch_script(package_dir)
+    if keep_dir:
+        package_dir.mkdir(exist_ok=True)
+        # Copy required files while the generated files are written; the
+        # steps touch disjoint files
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            copied = pool.submit(_copy_required_files, sources, package_dir)
+            written = pool.submit(_write_generated_files, package_dir, generated)
+            # Re-raise any error from either step
+            copied.result()
+            written.result()
     
-    # Create zip package
-    zip_path = _create_zip_archive(package_dir, package_name)
+    with tempfile.TemporaryDirectory() as tmp:
+        if bundle_wheels:
+            wheel_dir = package_dir / "wheels" if keep_dir else Path(tmp)
+            _download_wheels(wheel_dir)
+            sources += [
+                (wheel, f"wheels/{wheel.name}")
+                for wheel in sorted(wheel_dir.iterdir()) if wheel.is_file()
+            ]
+        
+        # Create zip package
+        zip_path = _create_zip_archive(package_name, sources, generated)
     
     # Print usage instructions
-    _print_usage_instructions(zip_path, package_dir)
+    _print_usage_instructions(zip_path, package_dir if keep_dir else None)
+    return zip_path
 
 
-def _copy_required_files(model_file: Path, model_filename: str, package_dir: Path) -> None:
+def _copy_required_files(sources, package_dir: Path) -> None:
     """
     Copy model and required Python scripts to the package directory.
     
+    Files are hardlinked when the package directory is on the same
+    filesystem, so the model is not duplicated on disk.
+    
     Args:
-        model_file: Path object for the model file
-        model_filename: Name of the model file
+        sources: Iterable of (source path, name in package) pairs
         package_dir: Destination package directory
+    """
+    for src, name in sources:
+        _link_or_copy(src, package_dir / name)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Hardlink src to dst, falling back to a copy across filesystems.
     
-    Raises:
-        FileNotFoundError: If required scripts are missing
+    A dst left by an earlier --keep-dir run is reused when it is already
+    a link to src, or a copy with the same size and mtime.
+    
+    Args:
+        src: Source file
+        dst: Destination path; replaced if it is out of date
     """
-    required_scripts = ["infer.py", "model_loader.py"]
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        pass
+    else:
+        if os.path.samestat(src_stat, dst_stat) or (
+            src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+        ):
+            return
     
-    # Copy model file
-    shutil.copy(model_file, package_dir / model_filename)
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # copy2 keeps the mtime so the check above matches on the next run
+        shutil.copy2(src, dst)
+
+
+def _write_generated_files(package_dir: Path, files) -> None:
+    """
+    Write generated files into the package directory.
     
-    # Copy required scripts
-    for script in required_scripts:
-        script_path = Path(script)
-        if not script_path.exists():
-            raise FileNotFoundError(f"Required script not found: {script}")
-        shutil.copy(script_path, package_dir / script)
+    Files that already hold the same bytes are not rewritten.
+    
+    Args:
+        package_dir: Package directory to write into
+        files: Iterable of (file name, bytes, permission bits) tuples
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for name, data, mode in files:
+        path = package_dir / name
+        try:
+            unchanged = (path.stat().st_size == len(data)
+                         and path.read_bytes() == data)
+        except FileNotFoundError:
+            unchanged = False
+        
+        if not unchanged:
+            fd = os.open(path, flags, mode)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        
+        # Make scripts executable on Unix-like systems; os.open only applies
+        # the mode to newly created files
+        if mode & 0o111:
+            try:
+                path.chmod(mode)
+            except (OSError, NotImplementedError):
+                # Windows or other systems that don't support chmod
+                pass
+
+
+def _requirements_text() -> bytes:
+    """
+    Build requirements.txt with necessary dependencies.
+    
+    Returns:
+        Encoded requirements.txt contents
+    """
+    return b"torch\ntorchvision\n"
 
 
-def _create_requirements_file(package_dir: Path) -> None:
+def _download_wheels(wheel_dir: Path) -> None:
     """
-    Create requirements.txt with necessary dependencies.
+    Download wheels for the packaged requirements.
     
     Args:
-        package_dir: Package directory where requirements.txt will be created
+        wheel_dir: Directory to download the wheels into
     """
-    requirements = "torch\ntorchvision\n"
-    (package_dir / "requirements.txt").write_text(requirements, encoding="utf-8")
+    print("📥 Downloading wheels...")
+    requirements = _requirements_text().decode("utf-8").split()
+    subprocess.check_call(
+        [sys.executable, "-m", "pip", "download", "-q", "-d", str(wheel_dir), *requirements]
+    )
 
 
-def _create_run_script(package_dir: Path, model_filename: str) -> None:
+def _run_script(model_filename: str) -> bytes:
     """
-    Create a Python run script for Unix/Mac systems.
+    Build the Python run script for Unix/Mac systems.
     
     Args:
-        package_dir: Package directory where run.py will be created
         model_filename: Name of the model file to pass to infer.py
+    
+    Returns:
+        Encoded run.py contents
     """
     run_script = f"""#!/usr/bin/env python3
 \"\"\"
 Automated run script for model inference.
-This script installs dependencies and runs inference on the packaged model.
+This script installs dependencies if they are missing and runs inference on
+the packaged model. Bundled wheels in wheels/ are installed offline.
 \"\"\"
+import importlib.util
+import os
 import sys
 import subprocess
 
+REQUIRED_MODULES = ("torch", "torchvision")
+
 
 def main():
     \"\"\"Install dependencies and run inference.\"\"\"
-    print("Installing dependencies...")
-    try:
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-q", "-r", "requirements.txt"]
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"Error installing dependencies: {{e}}", file=sys.stderr)
-        return 1
+    # find_spec only locates the modules, so the already-installed case
+    # costs microseconds instead of a pip resolver run
+    if any(importlib.util.find_spec(name) is None for name in REQUIRED_MODULES):
+        print("Installing dependencies...")
+        cmd = [sys.executable, "-m", "pip", "install", "-q", "-r", "requirements.txt"]
+        if os.path.isdir("wheels"):
+            cmd += ["--no-index", "--find-links", "wheels"]
+        try:
+            subprocess.check_call(cmd)
+        except subprocess.CalledProcessError as e:
+            print(f"Error installing dependencies: {{e}}", file=sys.stderr)
+            return 1
     
     print("Running inference...")
     try:
@@ -130,25 +270,17 @@ def main():
 if __name__ == "__main__":
     sys.exit(main())
 """
-    run_script_path = package_dir / "run.py"
-    run_script_path.write_text(run_script, encoding="utf-8")
-    
-    # Make executable on Unix-like systems
-    try:
-        run_script_path.chmod(0o755)
-    except (OSError, NotImplementedError):
-        # Windows or other systems that don't support chmod
-        pass
+    return run_script.encode("utf-8")
 
 
-def _create_batch_script(package_dir: Path) -> None:
+def _batch_script() -> bytes:
     """
-    Create a Windows batch script for easy execution.
+    Build the Windows batch script for easy execution.
     
-    Args:
-        package_dir: Package directory where run.bat will be created
+    Returns:
+        Encoded run.bat contents
     """
-    batch_script = """@echo off
+    return b"""@echo off
 echo Running model inference...
 python run.py
 if %ERRORLEVEL% NEQ 0 (
@@ -160,40 +292,84 @@ echo.
 echo Execution completed successfully.
 pause
 """
-    (package_dir / "run.bat").write_text(batch_script, encoding="utf-8")
 
 
-def _create_zip_archive(package_dir: Path, package_name: str) -> str:
+def _create_zip_archive(package_name: str, sources, generated) -> str:
     """
-    Create a zip archive of the package directory.
+    Create the zip archive of the package.
+    
+    Model weights are stored uncompressed and streamed from a read-only mmap
+    of the source file; scripts and other text files are deflated at a low
+    compression level. Generated files are written from memory. Every
+    member's ZipInfo is built from a single stat before the archive is
+    opened.
     
     Args:
-        package_dir: Directory to be zipped
         package_name: Base name for the zip file
+        sources: Iterable of (source path, name in package) pairs
+        generated: Iterable of (name in package, bytes, permission bits)
     
     Returns:
         Path to the created zip file
     """
     zip_path = f"{package_name}_package.zip"
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file in package_dir.rglob("*"):
-            if file.is_file():
-                # Preserve directory structure within zip relative to package_dir
-                zipf.write(file, arcname=file.relative_to(package_dir.parent))
+    # Members live under a top-level <package_name>_package/ directory
+    root = f"{package_name}_package"
+    entries = []
+    for src, name in sources:
+        zinfo = zipfile.ZipInfo.from_file(src, f"{root}/{name}")
+        zinfo.compress_type = (
+            zipfile.ZIP_STORED if src.suffix.lower() in _STORED_SUFFIXES
+            else zipfile.ZIP_DEFLATED
+        )
+        entries.append((src, zinfo))
+    
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        date_time = time.localtime()[:6]
+        for name, data, mode in generated:
+            zinfo = zipfile.ZipInfo(f"{root}/{name}", date_time=date_time)
+            zinfo.external_attr = (stat.S_IFREG | mode) << 16
+            zipf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+        
+        for src, zinfo in entries:
+            if zinfo.compress_type == zipfile.ZIP_STORED:
+                _write_stored(zipf, src, zinfo)
+            else:
+                zipf.writestr(zinfo, src.read_bytes(), compresslevel=1)
     
     return zip_path
 
 
-def _print_usage_instructions(zip_path: str, package_dir: Path) -> None:
+def _write_stored(zipf: zipfile.ZipFile, file: Path, zinfo: zipfile.ZipInfo) -> None:
+    """
+    Add a file to the archive uncompressed, without buffering it in Python.
+    
+    The source is mmapped and handed to the zip writer as one buffer, so the
+    weight bytes go from the page cache to the archive in a single write
+    instead of being read through chunked Python buffers.
+    
+    Args:
+        zipf: Open archive to write to
+        file: Source file
+        zinfo: Member entry for the file, with ZIP_STORED compression
+    """
+    with open(file, "rb") as src, zipf.open(zinfo, "w") as dst:
+        if zinfo.file_size:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                dst.write(mm)
+
+
+def _print_usage_instructions(zip_path: str, package_dir: Path = None) -> None:
     """
     Print usage instructions for the created package.
     
     Args:
         zip_path: Path to the created zip file
-        package_dir: Path to the package directory
+        package_dir: Path to the package directory, if one was written
     """
     print(f"✅ Created package: {zip_path}")
-    print(f"📁 Package contents: {package_dir}")
+    if package_dir is not None:
+        print(f"📁 Package contents: {package_dir}")
     print("\n🚀 To use:")
     print(f"   1. Extract {zip_path}")
     print(f"   2. Run: python run.py (Unix/Mac/Linux)")
@@ -228,11 +404,26 @@ Examples:
         required=True,
         help="Package name (without extension)"
     )
+    parser.add_argument(
+        "--bundle-wheels",
+        action="store_true",
+        help="Download dependency wheels into the package for offline installs"
+    )
+    parser.add_argument(
+        "--keep-dir",
+        action="store_true",
+        help="Also write the unpacked package directory next to the zip"
+    )
     
     args = parser.parse_args()
     
     try:
-        create_python_package(args.input, args.name)
+        create_python_package(
+            args.input,
+            args.name,
+            bundle_wheels=args.bundle_wheels,
+            keep_dir=args.keep_dir
+        )
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         return 1
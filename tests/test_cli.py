@@ -0,0 +1,10 @@
+"""
+Check that the pre-rendered help text in cli.py matches the real parser.
+"""
+import cli
+
+
+def test_help_text_matches_parser(monkeypatch):
+    # argparse wraps help to the terminal width; _HELP_TEXT is rendered at 80
+    monkeypatch.setenv("COLUMNS", "80")
+    assert cli._render_help() == cli._HELP_TEXT
@@ -0,0 +1,57 @@
+"""
+Check preprocess.preprocess_image against the torchvision pipeline it replaces.
+"""
+import numpy as np
+import pytest
+from PIL import Image
+
+import preprocess
+
+
+def _non_square_image():
+    """Random RGB image that is wider than it is tall, with odd crop offsets."""
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, size=(301, 417, 3), dtype=np.uint8), "RGB")
+
+
+def _crop_norm_kernels():
+    """NumPy fallback plus the Numba kernel when Numba is installed."""
+    kernels = [pytest.param(preprocess._crop_norm_numpy, id="numpy")]
+    if preprocess.njit is not None:
+        kernels.append(pytest.param(preprocess._crop_norm, id="numba"))
+    return kernels
+
+
+@pytest.mark.parametrize("kernel", _crop_norm_kernels())
+def test_matches_torchvision(monkeypatch, kernel):
+    torch = pytest.importorskip("torch")
+    transforms = pytest.importorskip("torchvision.transforms")
+    monkeypatch.setattr(preprocess, "_crop_norm", kernel)
+    
+    image = _non_square_image()
+    expected = transforms.Compose([
+        transforms.Resize(preprocess.RESIZE_SIZE),
+        transforms.CenterCrop(preprocess.CROP_SIZE),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+    ])(image).unsqueeze(0)
+    
+    actual = torch.from_numpy(preprocess.preprocess_image(image))
+    
+    assert actual.shape == expected.shape
+    assert actual.dtype == torch.float32
+    torch.testing.assert_close(actual, expected, rtol=0, atol=1e-5)
+
+
+def test_numba_matches_numpy():
+    if preprocess.njit is None:
+        pytest.skip("numba is not installed")
+    
+    img = np.asarray(_non_square_image().resize((348, 256)), dtype=np.uint8)
+    shape = (3, preprocess.CROP_SIZE, preprocess.CROP_SIZE)
+    expected = np.empty(shape, dtype=np.float32)
+    actual = np.empty(shape, dtype=np.float32)
+    preprocess._crop_norm_numpy(img, 16, 62, preprocess._SCALE, preprocess._OFFSET, expected)
+    preprocess._crop_norm(img, 16, 62, preprocess._SCALE, preprocess._OFFSET, actual)
+    
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-5)